@@ -2,7 +2,7 @@
 Invoice extractors for different suppliers.
 """
 
-from .base_extractor import BaseExtractor, PDFExtractionError
+from .base_extractor import BaseExtractor, PDFExtractionError, read_pdf_pages
 from .aaw_extractor import AAWExtractor
 from .cjl_extractor import CJLExtractor
 from .amazon_extractor import AmazonExtractor
@@ -12,6 +12,7 @@ from .generic_extractor import GenericExtractor
 __all__ = [
     "BaseExtractor",
     "PDFExtractionError",
+    "read_pdf_pages",
     "AAWExtractor",
     "CJLExtractor",
     "AmazonExtractor",
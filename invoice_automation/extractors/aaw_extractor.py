@@ -15,7 +15,7 @@ from ..models import Invoice
 class AAWExtractor(BaseExtractor):
     """Extractor for AAW National (PANDA) invoices."""
 
-    def extract(self, pdf_path: Path) -> Invoice:
+    def extract(self, pdf_path: Path, text: Optional[str] = None) -> Invoice:
         """
         Extract invoice data from AAW National PDF.
 
@@ -30,6 +30,7 @@ class AAWExtractor(BaseExtractor):
 
         Args:
             pdf_path: Path to the AAW invoice PDF
+            text: Already-extracted PDF text, if the caller has it
 
         Returns:
             Invoice object with extracted data
@@ -38,7 +39,8 @@ class AAWExtractor(BaseExtractor):
             PDFExtractionError: If extraction fails
         """
         # Extract text from PDF
-        text = self._extract_text(pdf_path)
+        if text is None:
+            text = self._extract_text(pdf_path)
 
         # Extract invoice number
         invoice_number = self._extract_invoice_number(text)
@@ -11,11 +11,16 @@ import re
 from .base_extractor import BaseExtractor, PDFExtractionError
 from ..models import Invoice
 
+_ZERO = Decimal("0")
+
+# Gross-to-net divisor at the standard 20% VAT rate
+_VAT_MULTIPLIER = Decimal("1.20")
+
 
 class AmazonExtractor(BaseExtractor):
     """Extractor for Amazon Business invoices."""
 
-    def extract(self, pdf_path: Path) -> Invoice:
+    def extract(self, pdf_path: Path, text: Optional[str] = None) -> Invoice:
         """
         Extract invoice data from Amazon Business PDF.
 
@@ -28,6 +33,7 @@ class AmazonExtractor(BaseExtractor):
 
         Args:
             pdf_path: Path to the Amazon invoice PDF
+            text: Already-extracted PDF text, if the caller has it
 
         Returns:
             Invoice object with extracted data
@@ -36,7 +42,8 @@ class AmazonExtractor(BaseExtractor):
             PDFExtractionError: If extraction fails
         """
         # Extract text from PDF
-        text = self._extract_text(pdf_path)
+        if text is None:
+            text = self._extract_text(pdf_path)
 
         # Extract invoice number
         invoice_number = self._extract_invoice_number(text)
@@ -74,8 +81,8 @@ class AmazonExtractor(BaseExtractor):
             po_number=po_number,
             store_location=store_location,
             store_address=store_address,
-            net_amount=net_amount or Decimal("0"),
-            vat_amount=vat_amount or Decimal("0"),
+            net_amount=net_amount or _ZERO,
+            vat_amount=vat_amount or _ZERO,
             total_amount=total_amount,
             nominal_code=nominal_code,
             description=description,
@@ -227,7 +234,7 @@ class AmazonExtractor(BaseExtractor):
         # Calculate missing values if we only have total
         if total_amount and not net_amount:
             # Assume 20% VAT
-            net_amount = total_amount / Decimal("1.20")
+            net_amount = total_amount / _VAT_MULTIPLIER
             vat_amount = total_amount - net_amount
 
         return net_amount, vat_amount, total_amount
@@ -3,6 +3,7 @@ APS Fire Systems invoice extractor.
 """
 
 from pathlib import Path
+from typing import Optional
 import re
 
 from .base_extractor import BaseExtractor
@@ -12,17 +13,19 @@ from ..models import Invoice
 class APSExtractor(BaseExtractor):
     """Extractor for APS Fire Systems invoices."""
 
-    def extract(self, pdf_path: Path) -> Invoice:
+    def extract(self, pdf_path: Path, text: Optional[str] = None) -> Invoice:
         """
         Extract invoice data from APS PDF.
 
         Args:
             pdf_path: Path to the APS invoice PDF
+            text: Already-extracted PDF text, if the caller has it
 
         Returns:
             Invoice object with extracted data
         """
-        text = self._extract_text(pdf_path)
+        if text is None:
+            text = self._extract_text(pdf_path)
 
         # Try multiple patterns for invoice number
         invoice_number = (
@@ -4,7 +4,7 @@ Base extractor class for PDF invoice extraction.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict
+from typing import BinaryIO, Dict, List, Optional
 import re
 import pdfplumber
 
@@ -18,6 +18,31 @@ class PDFExtractionError(Exception):
     pass
 
 
+def read_pdf_pages(
+    pdf_path: Path, stream: Optional[BinaryIO] = None
+) -> List[Optional[str]]:
+    """
+    Extract the text of every page of a PDF in a single pdfplumber pass.
+
+    Args:
+        pdf_path: Path to the PDF file (only named in errors if stream is given)
+        stream: Open binary stream of the PDF, read instead of pdf_path
+
+    Returns:
+        Per-page text, in page order (None for a page with no text layer)
+
+    Raises:
+        PDFExtractionError: If PDF cannot be read
+    """
+    try:
+        with pdfplumber.open(pdf_path if stream is None else stream) as pdf:
+            return [page.extract_text() for page in pdf.pages]
+    except Exception as e:
+        raise PDFExtractionError(
+            f"Failed to extract text from {pdf_path}: {str(e)}"
+        )
+
+
 class BaseExtractor(ABC):
     """
     Abstract base class for invoice extractors.
@@ -52,12 +77,14 @@ class BaseExtractor(ABC):
         return cls._pattern_cache[cache_key]
 
     @abstractmethod
-    def extract(self, pdf_path: Path) -> Invoice:
+    def extract(self, pdf_path: Path, text: Optional[str] = None) -> Invoice:
         """
         Extract invoice data from a PDF file.
 
         Args:
             pdf_path: Path to the PDF file
+            text: The PDF's already-extracted text, if the caller has it
+                (saves opening the PDF a second time)
 
         Returns:
             Invoice object with extracted data
@@ -80,18 +107,7 @@ class BaseExtractor(ABC):
         Raises:
             PDFExtractionError: If PDF cannot be read
         """
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text_parts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                return "\n".join(text_parts)
-        except Exception as e:
-            raise PDFExtractionError(
-                f"Failed to extract text from {pdf_path}: {str(e)}"
-            )
+        return "\n".join(text for text in read_pdf_pages(pdf_path) if text)
 
     def _find_pattern(self, text: str, pattern: str, flags: int = 0) -> Optional[str]:
         """
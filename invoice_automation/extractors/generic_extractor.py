@@ -13,6 +13,11 @@ from ..models import Invoice
 from ..utils.supplier_registry import identify_supplier as _identify_supplier_registry
 from ..utils import store_registry
 
+_ZERO = Decimal("0")
+
+# Anything this large on a "VAT" line is a VAT registration number, not an amount
+_MAX_VAT_AMOUNT = Decimal("100000")
+
 
 class GenericExtractor(BaseExtractor):
     """Generic extractor for invoices from unknown suppliers."""
@@ -30,6 +35,13 @@ class GenericExtractor(BaseExtractor):
         r"ER\d{2}/\d{5}",
     ]
 
+    # PO_PATTERNS compiled, and joined into one alternation (group "p<i>" is
+    # PO_PATTERNS[i]) so a text can be checked for all of them in one scan
+    _PO_COMPILED = [re.compile(p) for p in PO_PATTERNS]
+    _PO_ANY = re.compile(
+        "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(PO_PATTERNS))
+    )
+
     # Values that are clearly NOT PO numbers
     PO_REJECT_PATTERNS = [
         r"^[A-Z][a-z]+\s+[A-Z][a-z]+",  # Person names like "Sam Boyle"
@@ -39,9 +51,10 @@ class GenericExtractor(BaseExtractor):
         r"^[A-Z]{1,2}$",  # Single/double letters like "P", "PO"
     ]
 
-    def extract(self, pdf_path: Path) -> Invoice:
+    def extract(self, pdf_path: Path, text: Optional[str] = None) -> Invoice:
         """Extract invoice data using generic patterns."""
-        text = self._extract_text(pdf_path)
+        if text is None:
+            text = self._extract_text(pdf_path)
 
         invoice_number = self._extract_invoice_number(text, pdf_path.name)
         po_number = self._extract_po_number(text)
@@ -75,9 +88,10 @@ class GenericExtractor(BaseExtractor):
         # Extract description
         description = self._extract_description(text)
 
-        # Determine supplier
-        supplier_name = self._identify_supplier(text, pdf_path.name)
-        supplier_type = self._identify_supplier_type(text, pdf_path.name)
+        # Determine supplier (name and sheet-routing type from one registry scan)
+        supplier_name, supplier_type = _identify_supplier_registry(
+            text, pdf_path.name
+        )
 
         invoice = Invoice(
             invoice_number=invoice_number,
@@ -87,9 +101,9 @@ class GenericExtractor(BaseExtractor):
             po_number=po_number,
             store_location=store_location,
             store_address="",
-            net_amount=net_amount or Decimal("0"),
-            vat_amount=vat_amount or Decimal("0"),
-            total_amount=total_amount or Decimal("0"),
+            net_amount=net_amount or _ZERO,
+            vat_amount=vat_amount or _ZERO,
+            total_amount=total_amount or _ZERO,
             nominal_code=nominal_code,
             description=description,
             raw_text=text,
@@ -170,11 +184,17 @@ class GenericExtractor(BaseExtractor):
                 if self._is_valid_po(candidate):
                     return candidate
 
-        # Strategy 2: Look for known PO patterns anywhere in text
-        for po_pattern in self.PO_PATTERNS:
-            match = re.search(po_pattern, text)
-            if match:
-                return match.group(0)
+        # Strategy 2: Look for known PO patterns anywhere in text. One scan
+        # finds the first PO-like code; a pattern listed earlier than the one
+        # that matched it still wins if it matches further along the text.
+        hit = self._PO_ANY.search(text)
+        if hit:
+            first = int(hit.lastgroup[1:])
+            for po_pattern in self._PO_COMPILED[:first]:
+                match = po_pattern.search(text, hit.start() + 1)
+                if match:
+                    return match.group(0)
+            return hit.group(0)
 
         # Strategy 3: Generic PO/Order field extraction (with validation)
         generic_patterns = [
@@ -255,9 +275,9 @@ class GenericExtractor(BaseExtractor):
             match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
             if match:
                 amount = self.amount_parser.parse_amount(match.group(1))
-                if amount and amount > Decimal("0"):
+                if amount and amount > _ZERO:
                     return amount
-        return Decimal("0")
+        return _ZERO
 
     def _extract_vat_amount(self, text: str) -> Decimal:
         """Extract VAT amount, avoiding VAT registration numbers."""
@@ -283,12 +303,12 @@ class GenericExtractor(BaseExtractor):
             match = re.search(pattern, text, re.IGNORECASE)
             if match:
                 amount = self.amount_parser.parse_amount(match.group(1))
-                if amount and amount > Decimal("0"):
+                if amount and amount > _ZERO:
                     # Sanity check: VAT should be reasonable (not a reg number)
-                    if amount < Decimal("100000"):
+                    if amount < _MAX_VAT_AMOUNT:
                         return amount
 
-        return Decimal("0")
+        return _ZERO
 
     def _extract_total_amount(self, text: str) -> Decimal:
         """Extract total amount."""
@@ -315,9 +335,9 @@ class GenericExtractor(BaseExtractor):
             match = re.search(pattern, text, re.IGNORECASE)
             if match:
                 amount = self.amount_parser.parse_amount(match.group(1))
-                if amount and amount > Decimal("0"):
+                if amount and amount > _ZERO:
                     return amount
-        return Decimal("0")
+        return _ZERO
 
     # Menkind HQ / billing address — never a store location
     _BILLING_CITIES = {"dorking"}
@@ -327,8 +347,8 @@ class GenericExtractor(BaseExtractor):
 
         The canonical list lives in ``data/known_stores.json`` (editable in-app
         via the sidebar) and falls back to ``store_registry`` defaults. It is read
-        per-instance: extractors are rebuilt on every run (``get_extractors`` is
-        not cached), so a saved edit takes effect on the next Process. A candidate
+        per-instance: extractors are rebuilt on every run (``get_extractor`` only
+        caches within a run), so a saved edit takes effect on the next Process. A candidate
         store is only shown if it snaps to one of these names; otherwise "" is
         returned and the card shows "Store: Unknown".
         """
@@ -481,13 +501,3 @@ class GenericExtractor(BaseExtractor):
                 if desc and len(desc) > 5:
                     return desc[:500]
         return ""
-
-    def _identify_supplier(self, text: str, filename: str) -> str:
-        """Identify supplier name from text or filename."""
-        name, _ = _identify_supplier_registry(text, filename)
-        return name
-
-    def _identify_supplier_type(self, text: str, filename: str) -> str:
-        """Identify supplier type code for sheet routing."""
-        _, stype = _identify_supplier_registry(text, filename)
-        return stype
@@ -18,11 +18,14 @@ class ValidationSeverity(Enum):
     INFO = "INFO"  # Informational message
 
 
-@dataclass
+@dataclass(slots=True)
 class Validation:
     """
     Represents a single validation check result.
 
+    Slotted: every invoice produces several of these, and validators only
+    ever set the declared fields.
+
     Attributes:
         check_name: Name/description of the validation check
         passed: Whether the validation passed
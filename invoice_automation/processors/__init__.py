@@ -3,11 +3,12 @@ Excel processors for reading and writing PO records.
 """
 
 from .excel_reader import ExcelReader
-from .excel_writer import ExcelWriter
+from .excel_writer import ExcelWriter, PORecordUpdate
 from .sheet_selector import SheetSelector
 
 __all__ = [
     "ExcelReader",
     "ExcelWriter",
+    "PORecordUpdate",
     "SheetSelector",
 ]
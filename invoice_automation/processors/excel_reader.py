@@ -2,16 +2,18 @@
 Excel reader for loading reference data and PO records.
 """
 
+import heapq
 import logging
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
 
 import pandas as pd
 
 from ..models import PORecord, Invoice
-from ..utils import DateParser
+from ..utils import DateParser, StringMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +40,14 @@ class ExcelReader:
         self.cost_centre_path = Path(cost_centre_path) if cost_centre_path else None
         self.date_parser = DateParser()
         self._sheet_cache: Dict[str, Optional[pd.DataFrame]] = {}
+        # sheet name -> {PO / invoice number line: row position}, built on the
+        # first lookup against each sheet so later invoices are a dict hit
+        self._po_index: Dict[str, Dict[str, int]] = {}
+        self._invoice_index: Dict[str, Dict[str, int]] = {}
         self._workbook_sheets: Optional[set] = None
+        # Held open by load_maintenance_sheets so every sheet is parsed from one
+        # workbook load instead of two pd.read_excel round-trips per sheet.
+        self._excel_file: Optional[pd.ExcelFile] = None
         # Sheets that EXIST in the workbook but couldn't be loaded / had no
         # detectable header. Surfaced to the user because they silently turn
         # every PO on that sheet into a "not found" — a wrong, confident result.
@@ -48,14 +57,28 @@ class ExcelReader:
         """Names of sheets actually present in the workbook (cached)."""
         if self._workbook_sheets is None:
             try:
-                self._workbook_sheets = set(
-                    pd.ExcelFile(self.maintenance_workbook_path).sheet_names
-                )
+                with self._open_workbook():
+                    pass  # opening records the sheet names
             except Exception as e:
                 logger.warning("Could not list workbook sheets: %s", e)
                 self._workbook_sheets = set()
         return self._workbook_sheets
 
+    @contextmanager
+    def _open_workbook(self) -> Iterator[pd.ExcelFile]:
+        """Yield the workbook, reusing the one a batch load already holds open."""
+        if self._excel_file is not None:
+            yield self._excel_file
+            return
+        with pd.ExcelFile(self.maintenance_workbook_path) as xl:
+            if self._workbook_sheets is None:
+                self._workbook_sheets = set(xl.sheet_names)
+            self._excel_file = xl
+            try:
+                yield xl
+            finally:
+                self._excel_file = None
+
     def _read_sheet_with_header_detection(
         self, sheet_name: str
     ) -> Optional[pd.DataFrame]:
@@ -70,18 +93,19 @@ class ExcelReader:
             return self._sheet_cache[sheet_name]
 
         try:
-            # Read raw to find header row
-            raw = pd.read_excel(
-                self.maintenance_workbook_path,
-                sheet_name=sheet_name,
-                header=None,
-                nrows=20,
-                dtype=str,
-            )
+            with self._open_workbook() as xl:
+                df = self._parse_sheet(xl, sheet_name)
         except Exception as e:
             self._record_load_failure(sheet_name, e)
-            self._sheet_cache[sheet_name] = None
-            return None
+            df = None
+
+        self._sheet_cache[sheet_name] = df
+        return df
+
+    def _parse_sheet(self, xl: pd.ExcelFile, sheet_name: str) -> Optional[pd.DataFrame]:
+        """Parse one sheet of an open workbook (see _read_sheet_with_header_detection)."""
+        # Read raw to find header row
+        raw = xl.parse(sheet_name, header=None, nrows=20, dtype=str)
 
         # Find the row that contains 'PO' as a cell value
         header_row = None
@@ -96,31 +120,15 @@ class ExcelReader:
         if header_row is None:
             # Fallback: read with default header
             try:
-                df = pd.read_excel(
-                    self.maintenance_workbook_path, sheet_name=sheet_name, dtype=str
-                )
+                return xl.parse(sheet_name, dtype=str)
             except Exception:
-                df = None
-            self._sheet_cache[sheet_name] = df
-            return df
+                return None
 
         # Re-read with detected header row
-        try:
-            df = pd.read_excel(
-                self.maintenance_workbook_path,
-                sheet_name=sheet_name,
-                header=header_row,
-                dtype=str,
-            )
-        except Exception as e:
-            self._record_load_failure(sheet_name, e)
-            self._sheet_cache[sheet_name] = None
-            return None
+        df = xl.parse(sheet_name, header=header_row, dtype=str)
 
         # Normalize column names
         df.columns = [self._normalize_column_name(c) for c in df.columns]
-
-        self._sheet_cache[sheet_name] = df
         return df
 
     def _record_load_failure(self, sheet_name: str, error: Exception) -> None:
@@ -166,10 +174,15 @@ class ExcelReader:
     def load_maintenance_sheets(self) -> Dict[str, pd.DataFrame]:
         """Load all maintenance PO sheets from the workbook."""
         sheets = {}
-        for sheet_name in self.MAINTENANCE_SHEETS:
-            df = self._read_sheet_with_header_detection(sheet_name)
-            if df is not None:
-                sheets[sheet_name] = df
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(self._open_workbook())
+            except Exception:
+                pass  # each sheet read below reports the failure itself
+            for sheet_name in self.MAINTENANCE_SHEETS:
+                df = self._read_sheet_with_header_detection(sheet_name)
+                if df is not None:
+                    sheets[sheet_name] = df
 
         return sheets
 
@@ -217,20 +230,20 @@ class ExcelReader:
 
         po_clean = str(po_number).strip().upper()
 
-        def _cell_matches(cell: object) -> bool:
-            # Split on newlines so a wrapped/multi-PO cell still matches exactly.
-            return po_clean in [line.strip() for line in str(cell).upper().split("\n")]
-
-        mask = df["PO"].fillna("").astype(str).apply(_cell_matches)
-        matches = df[mask]
-
-        if matches.empty:
+        if sheet_name not in self._po_index:
+            # Index every line of every PO cell (split on newlines so a
+            # wrapped/multi-PO cell still matches exactly); first row wins.
+            index: Dict[str, int] = {}
+            for pos, cell in enumerate(df["PO"].fillna("").astype(str)):
+                for line in cell.upper().split("\n"):
+                    index.setdefault(line.strip(), pos)
+            self._po_index[sheet_name] = index
+
+        pos = self._po_index[sheet_name].get(po_clean)
+        if pos is None:
             return None
 
-        idx = matches.index[0]
-        row = matches.iloc[0]
-
-        return self._row_to_po_record(row, sheet_name, idx)
+        return self._row_to_po_record(df.iloc[pos], sheet_name, df.index[pos])
 
     def find_by_invoice_number(
         self, invoice_number: str, sheet_name: str
@@ -258,36 +271,44 @@ class ExcelReader:
 
         inv_clean = str(invoice_number).strip().upper()
 
-        # Check each row — cells may contain multiple invoice numbers separated by newlines
-        for idx, row in df.iterrows():
-            cell_val = str(row.get(inv_col, "")).strip()
-            if not cell_val or cell_val == "nan":
-                continue
-            # Split on newlines and check each part
-            parts = [p.strip().upper() for p in cell_val.split("\n") if p.strip()]
-            if inv_clean in parts:
-                return self._row_to_po_record(row, sheet_name, idx)
+        if sheet_name not in self._invoice_index:
+            # Index each row's invoice numbers — cells may contain several
+            # separated by newlines; the first row listing a number wins.
+            index: Dict[str, int] = {}
+            for pos, cell in enumerate(df[inv_col]):
+                cell_val = str(cell).strip()
+                if not cell_val or cell_val == "nan":
+                    continue
+                for part in cell_val.split("\n"):
+                    part = part.strip()
+                    if part:
+                        index.setdefault(part.upper(), pos)
+            self._invoice_index[sheet_name] = index
+
+        pos = self._invoice_index[sheet_name].get(inv_clean)
+        if pos is None:
+            return None
 
-        return None
+        return self._row_to_po_record(df.iloc[pos], sheet_name, df.index[pos])
 
     def find_po_candidates(
-        self, sheet_name: str, invoice: Invoice
+        self, sheet_name: str, invoice: Invoice, limit: Optional[int] = None
     ) -> List[Tuple[PORecord, float]]:
         """
         Find candidate PO records using fuzzy multi-field matching.
 
         Scores candidates by store name, company/supplier name, and amount proximity.
         Returns list of (PORecord, score) sorted by score descending.
-        """
-        from ..utils import StringMatcher
 
+        Args:
+            sheet_name: Name of the sheet to search
+            invoice: Invoice to score rows against
+            limit: Only return the best ``limit`` candidates (all if None)
+        """
         df = self._read_sheet_with_header_detection(sheet_name)
         if df is None:
             return []
 
-        string_matcher = StringMatcher()
-        candidates = []
-
         # Find invoice amount column once before the loop
         inv_amount_col = None
         for col in df.columns:
@@ -295,49 +316,62 @@ class ExcelReader:
                 inv_amount_col = col
                 break
 
-        for idx, row in df.iterrows():
-            score = 0.0
+        # Fuzzy-score the store and company columns against the invoice in one
+        # batch each, rather than one scorer call per row inside the loop.
+        stores = self._column_strs(df, "STORE")
+        companies = [
+            company or supplier
+            for company, supplier in zip(
+                self._column_strs(df, "COMPANY NAME"),
+                self._column_strs(df, "SUPPLIER"),
+            )
+        ]
+        store_scores = StringMatcher.fuzzy_match_scores(
+            invoice.store_location, stores
+        )
+        company_scores = StringMatcher.fuzzy_match_scores(
+            invoice.supplier_name, companies
+        )
 
-            # Store name matching (highest weight)
-            po_store = self._safe_str(row.get("STORE"))
-            if po_store and invoice.store_location:
-                store_score = string_matcher.fuzzy_match_score(
-                    invoice.store_location, po_store
-                )
-                score += store_score * 0.5  # 50% weight
+        # Reference amounts for the proximity score, also read column-wise
+        po_amounts = (
+            [self._safe_decimal(value) for value in df[inv_amount_col]]
+            if inv_amount_col
+            else [None] * len(df)
+        )
+        po_quotes = [
+            self._safe_decimal(quote) if quote else None
+            for quote in self._column_strs(df, "QUOTE OVER £200")
+        ]
 
-            # Company/supplier name matching (25% weight)
-            company = self._safe_str(row.get("COMPANY NAME")) or self._safe_str(
-                row.get("SUPPLIER")
-            )
-            if company and invoice.supplier_name:
-                company_score = string_matcher.fuzzy_match_score(
-                    invoice.supplier_name, company
-                )
-                score += company_score * 0.25
+        net_amount = invoice.net_amount
+        scored = []
+        for pos in range(len(df)):
+            # Store name (50% weight) and company/supplier name (25% weight)
+            score = store_scores[pos] * 0.5 + company_scores[pos] * 0.25
 
             # Amount proximity (25% weight)
-            quote_val = self._safe_str(row.get("QUOTE OVER £200"))
-            po_amount = (
-                self._safe_decimal(row.get(inv_amount_col)) if inv_amount_col else None
-            )
-            po_quote = self._safe_decimal(quote_val) if quote_val else None
-
-            ref_amount = po_amount or po_quote
-            if ref_amount and invoice.net_amount and ref_amount > 0:
+            ref_amount = po_amounts[pos] or po_quotes[pos]
+            if ref_amount and net_amount and ref_amount > 0:
                 ratio = float(
-                    min(invoice.net_amount, ref_amount)
-                    / max(invoice.net_amount, ref_amount)
+                    min(net_amount, ref_amount) / max(net_amount, ref_amount)
                 )
                 score += ratio * 100 * 0.25
 
             if score > 0:
-                po_record = self._row_to_po_record(row, sheet_name, idx)
-                candidates.append((po_record, score))
+                scored.append((pos, score))
+
+        # Sort by score descending (stable, so ties keep sheet order). Only the
+        # rows that are returned are converted to PORecords.
+        if limit is None:
+            scored.sort(key=lambda x: x[1], reverse=True)
+        else:
+            scored = heapq.nlargest(limit, scored, key=lambda x: x[1])
 
-        # Sort by score descending
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        return candidates
+        return [
+            (self._row_to_po_record(df.iloc[pos], sheet_name, df.index[pos]), score)
+            for pos, score in scored
+        ]
 
     def _row_to_po_record(
         self, row: pd.Series, sheet_name: str, row_index: int
@@ -369,6 +403,13 @@ class ExcelReader:
             company_name=company_name,
         )
 
+    @classmethod
+    def _column_strs(cls, df: pd.DataFrame, column: str) -> List[Optional[str]]:
+        """_safe_str of every value in a column (all None if it is missing)."""
+        if column not in df.columns:
+            return [None] * len(df)
+        return [cls._safe_str(value) for value in df[column]]
+
     @staticmethod
     def _safe_str(value: object) -> Optional[str]:
         """Convert value to string, handling NaN."""
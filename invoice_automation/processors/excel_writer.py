@@ -2,18 +2,28 @@
 Excel writer for updating PO records while preserving formatting.
 """
 
+import io
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
 
 import openpyxl
 from openpyxl.styles import PatternFill
-from shutil import copy2
+from shutil import copy2, copystat
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# Linux ioctl that makes dst a copy-on-write clone of src (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
 # Light blue fill applied to rows updated by automation
 _UPDATED_ROW_FILL = PatternFill(
     start_color="DAEEF3", end_color="DAEEF3", fill_type="solid"
@@ -25,6 +35,30 @@ _UPDATED_ROW_FILL = PatternFill(
 # downloaded workbook is opened.
 _FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 
+# Header names of the columns this writer fills in. The first three must be
+# present for an update; NOMINAL CODE is only filled when the sheet has one.
+_REQUIRED_COLUMNS = ("INVOICE NO.", "INVOICE AMOUNT (EX VAT)", "INVOICE SIGNED")
+_WRITABLE_COLUMNS = _REQUIRED_COLUMNS + ("NOMINAL CODE",)
+
+
+def _clone_or_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst, as a copy-on-write clone where the filesystem allows.
+
+    A clone shares the source's data blocks, so backing up a large workbook is
+    instant and uses no extra space until one of the files changes. A hardlink
+    would be cheaper still but is NOT a backup here: openpyxl saves by
+    truncating and rewriting the same file, which would overwrite both names.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            copystat(src, dst)
+            return
+        except OSError:
+            pass  # Not supported here (e.g. ext4, tmpfs) - fall back to a copy
+    copy2(src, dst)
+
 
 def _guard_formula(value: object) -> object:
     """Neutralise spreadsheet-formula injection in a text cell value."""
@@ -33,36 +67,83 @@ def _guard_formula(value: object) -> object:
     return value
 
 
+@dataclass(frozen=True)
+class PORecordUpdate:
+    """
+    Invoice details to write back to one PO record.
+
+    Attributes:
+        sheet_name: Name of the sheet holding the PO
+        row_index: Row index (0-based from pandas)
+        invoice_number: Invoice number
+        invoice_amount: Invoice amount (ex-VAT)
+        invoice_signed_date: Date invoice was signed
+        nominal_code: Nominal code to write (only if cell is empty)
+    """
+
+    sheet_name: str
+    row_index: int
+    invoice_number: str
+    invoice_amount: Union[Decimal, float]
+    invoice_signed_date: datetime
+    nominal_code: str = ""
+
+
 class ExcelWriter:
     """Writer for updating Excel workbooks while preserving formatting."""
 
-    def __init__(self, workbook_path: Path, create_backup: bool = True):
+    def __init__(
+        self, workbook_path: Union[Path, BinaryIO], create_backup: bool = True
+    ):
         """
         Initialize Excel writer.
 
         Args:
-            workbook_path: Path to the Excel workbook
+            workbook_path: Path to the Excel workbook, or a seekable binary
+                stream holding it (e.g. io.BytesIO); a stream is saved back
+                into itself and never backed up
             create_backup: Whether to create a backup before modifying
         """
-        self.workbook_path = Path(workbook_path)
+        if hasattr(workbook_path, "read"):
+            self.workbook_path = None
+            self._stream = workbook_path
+        else:
+            self.workbook_path = Path(workbook_path)
+            self._stream = None
         self.workbook = None
         self.modified = False
+        # sheet name -> (header row, column map), filled on first update
+        self._column_cache: Dict[str, Optional[Tuple[int, Dict[str, int]]]] = {}
 
         # Create backup if requested
-        if create_backup:
+        if create_backup and self.workbook_path is not None:
             backup_path = self.workbook_path.with_suffix(".backup.xlsx")
-            copy2(self.workbook_path, backup_path)
+            _clone_or_copy(self.workbook_path, backup_path)
             logger.info("Created backup: %s", backup_path)
 
-        # Load workbook
-        self.workbook = openpyxl.load_workbook(self.workbook_path)
+        # Load workbook. The flags are spelled out because each one matters:
+        # - data_only=False keeps formulas (True would save cached values
+        #   in their place and break the workbook's own calculations).
+        # - rich_text=False skips parsing rich-text runs; we only write
+        #   plain values.
+        # - keep_links=True stays the default: with False, openpyxl drops
+        #   external workbook links from the saved file.
+        self.workbook = openpyxl.load_workbook(
+            self.workbook_path if self._stream is None else self._stream,
+            data_only=False,
+            rich_text=False,
+            keep_links=True,
+        )
+        # The writer never adds or renames sheets, so the names are fixed
+        # for its lifetime; sheetnames builds a fresh list on every access.
+        self._sheet_names = frozenset(self.workbook.sheetnames)
 
     def update_po_record(
         self,
         sheet_name: str,
         row_index: int,
         invoice_number: str,
-        invoice_amount: Decimal,
+        invoice_amount: Union[Decimal, float],
         invoice_signed_date: datetime,
         nominal_code: str = "",
     ) -> bool:
@@ -73,85 +154,133 @@ class ExcelWriter:
             sheet_name: Name of the sheet
             row_index: Row index (0-based from pandas)
             invoice_number: Invoice number
-            invoice_amount: Invoice amount (ex-VAT)
+            invoice_amount: Invoice amount (ex-VAT). A float is written as-is;
+                a Decimal is converted once, before any worksheet work.
             invoice_signed_date: Date invoice was signed
             nominal_code: Nominal code to write (only if cell is empty)
 
         Returns:
             True if update successful, False otherwise
         """
-        try:
-            # Get the worksheet
-            if sheet_name not in self.workbook.sheetnames:
-                logger.error("Sheet '%s' not found", sheet_name)
-                return False
-
-            ws = self.workbook[sheet_name]
-
-            # Convert pandas row index to Excel row number
-            # Pandas row index 0 = Excel row 2 (assuming row 1 is header)
-            # However, we need to account for possible title rows
-            # Let's search for the header row first
-            header_row = self._find_header_row(ws)
-            if header_row is None:
-                logger.error("Could not find header row in sheet '%s'", sheet_name)
-                return False
+        update = PORecordUpdate(
+            sheet_name,
+            row_index,
+            invoice_number,
+            invoice_amount,
+            invoice_signed_date,
+            nominal_code,
+        )
+        return self.update_po_records([update]) == 1
+
+    def update_po_records(self, updates: Iterable[PORecordUpdate]) -> int:
+        """
+        Update many PO records in one pass.
 
-            # Actual Excel row = header_row + row_index + 1
-            excel_row = header_row + row_index + 1
+        Updates are grouped by sheet, so each worksheet and its header layout
+        are looked up once per batch rather than once per row. A failed update
+        is logged and skipped; the rest of the batch is still applied.
 
-            # Find column indices for the fields we need to update
-            col_invoice_no = self._find_column(ws, header_row, "INVOICE NO.")
-            col_invoice_amount = self._find_column(
-                ws, header_row, "INVOICE AMOUNT (EX VAT)"
-            )
-            col_invoice_signed = self._find_column(ws, header_row, "INVOICE SIGNED")
-
-            if not all([col_invoice_no, col_invoice_amount, col_invoice_signed]):
-                logger.error(
-                    "Could not find required columns in sheet '%s'", sheet_name
-                )
-                return False
-
-            # Update the cells. invoice_number is PDF/filename-derived (untrusted),
-            # so guard against Excel formula injection; the amount is a float.
-            ws.cell(row=excel_row, column=col_invoice_no).value = _guard_formula(
-                invoice_number
-            )
-            ws.cell(row=excel_row, column=col_invoice_amount).value = float(
-                invoice_amount
-            )
-            ws.cell(
-                row=excel_row, column=col_invoice_signed
-            ).value = invoice_signed_date
-
-            # Write nominal code if provided and cell is currently empty
-            if nominal_code:
-                col_nominal = self._find_column(ws, header_row, "NOMINAL CODE")
-                if col_nominal:
-                    existing = ws.cell(row=excel_row, column=col_nominal).value
-                    if not existing or str(existing).strip() == "":
-                        ws.cell(
-                            row=excel_row, column=col_nominal
-                        ).value = _guard_formula(nominal_code)
-
-            # Highlight the entire row light blue to mark it as processed
-            for col in range(1, ws.max_column + 1):
-                ws.cell(row=excel_row, column=col).fill = _UPDATED_ROW_FILL
-
-            self.modified = True
-            logger.info("Updated row %d in sheet '%s'", excel_row, sheet_name)
-            return True
+        Args:
+            updates: PO record updates to apply
 
-        except Exception:
-            logger.exception("Error updating PO record")
-            return False
+        Returns:
+            Number of records updated
+        """
+        by_sheet: Dict[str, List[PORecordUpdate]] = {}
+        for update in updates:
+            by_sheet.setdefault(update.sheet_name, []).append(update)
+
+        updated = 0
+        for sheet_name, sheet_updates in by_sheet.items():
+            try:
+                if sheet_name not in self._sheet_names:
+                    logger.error("Sheet '%s' not found", sheet_name)
+                    continue
+
+                ws = self.workbook[sheet_name]
+
+                # The sheet has title rows above the header, so locate the
+                # header row (and the columns we write) once per sheet.
+                layout = self._resolve_columns(ws, sheet_name)
+                if layout is None:
+                    logger.error(
+                        "Could not find header row in sheet '%s'", sheet_name
+                    )
+                    continue
+                header_row, columns = layout
+
+                if not all(columns.get(name) for name in _REQUIRED_COLUMNS):
+                    logger.error(
+                        "Could not find required columns in sheet '%s'", sheet_name
+                    )
+                    continue
+            except Exception:
+                logger.exception("Error reading sheet '%s'", sheet_name)
+                continue
+
+            for update in sheet_updates:
+                try:
+                    # Convert pandas row index to Excel row number:
+                    # actual Excel row = header_row + row_index + 1
+                    excel_row = header_row + update.row_index + 1
+                    self._write_row(ws, excel_row, columns, update)
+                except Exception:
+                    logger.exception("Error updating PO record")
+                    continue
+                updated += 1
+                self.modified = True
+                logger.info("Updated row %d in sheet '%s'", excel_row, sheet_name)
+
+        return updated
+
+    @staticmethod
+    def _write_row(
+        ws, excel_row: int, columns: Dict[str, int], update: PORecordUpdate
+    ) -> None:
+        """Write one update's invoice details into a worksheet row."""
+        # Excel stores numbers as floats. Convert once, before touching cells,
+        # so callers that already hold a float skip the Decimal conversion.
+        amount = update.invoice_amount
+        amount_value = amount if isinstance(amount, float) else float(amount)
+
+        # Update the cells. invoice_number is PDF/filename-derived (untrusted),
+        # so guard against Excel formula injection; the amount is a float.
+        ws.cell(
+            row=excel_row, column=columns["INVOICE NO."]
+        ).value = _guard_formula(update.invoice_number)
+        ws.cell(
+            row=excel_row, column=columns["INVOICE AMOUNT (EX VAT)"]
+        ).value = amount_value
+        ws.cell(
+            row=excel_row, column=columns["INVOICE SIGNED"]
+        ).value = update.invoice_signed_date
+
+        # Write nominal code if provided and cell is currently empty
+        if update.nominal_code:
+            col_nominal = columns.get("NOMINAL CODE")
+            if col_nominal:
+                existing = ws.cell(row=excel_row, column=col_nominal).value
+                if not existing or str(existing).strip() == "":
+                    ws.cell(
+                        row=excel_row, column=col_nominal
+                    ).value = _guard_formula(update.nominal_code)
+
+        # Highlight the entire row light blue to mark it as processed.
+        # openpyxl interns fills in the workbook's style table, so every
+        # highlighted cell shares one fill entry. A NamedStyle would not
+        # help: assigning cell.style resets the cell's font, border and
+        # number format too.
+        for cell in ws[excel_row]:
+            cell.fill = _UPDATED_ROW_FILL
 
     def _find_header_row(self, ws) -> Optional[int]:
         """
         Find the header row in a worksheet.
 
         Searches for a row containing 'PO' or 'INVOICE NO.' as indicators.
+        Header positions differ between sheets (row 5 or 6, after the
+        title/legend rows), so they are detected rather than hardcoded; the
+        result is cached per sheet by _resolve_columns.
 
         Args:
             ws: Worksheet object
@@ -159,34 +288,64 @@ class ExcelWriter:
         Returns:
             Row number (1-based), or None if not found
         """
-        for row_num in range(1, min(20, ws.max_row + 1)):  # Check first 20 rows
-            for cell in ws[row_num]:
-                if cell.value and isinstance(cell.value, str):
-                    value_upper = cell.value.strip().upper()
+        rows = ws.iter_rows(min_row=1, max_row=min(19, ws.max_row), values_only=True)
+        for row_num, values in enumerate(rows, start=1):  # Check first 20 rows
+            for value in values:
+                if value and isinstance(value, str):
+                    value_upper = value.strip().upper()
                     # Require exact match for 'PO' to avoid matching titles
                     # like "Maintenance - PO's & Outstanding..."
                     if value_upper == "PO" or "INVOICE NO" in value_upper:
                         return row_num
         return None
 
-    def _find_column(self, ws, header_row: int, column_name: str) -> Optional[int]:
+    def _resolve_columns(
+        self, ws, sheet_name: str
+    ) -> Optional[Tuple[int, Dict[str, int]]]:
+        """
+        Locate the header row and the writable columns of a sheet (cached).
+
+        Args:
+            ws: Worksheet object
+            sheet_name: Name of the sheet (cache key)
+
+        Returns:
+            (header_row, {column name: column number}), or None if the sheet
+            has no detectable header row
+        """
+        if sheet_name not in self._column_cache:
+            header_row = self._find_header_row(ws)
+            self._column_cache[sheet_name] = (
+                None
+                if header_row is None
+                else (header_row, self._build_column_map(ws, header_row))
+            )
+        return self._column_cache[sheet_name]
+
+    @staticmethod
+    def _build_column_map(ws, header_row: int) -> Dict[str, int]:
         """
-        Find the column index for a given column name.
+        Map each writable column name to its column number in one header pass.
+
+        A header matches when it contains the column name (headers may carry
+        newlines or suffixes, e.g. "INVOICE NO.\n"); the leftmost match wins.
 
         Args:
             ws: Worksheet object
             header_row: Row number containing headers (1-based)
-            column_name: Name of the column to find
 
         Returns:
-            Column number (1-based), or None if not found
+            Dict of column name -> column number (1-based); names not present
+            in the header row are omitted
         """
-        column_name_upper = column_name.upper()
+        columns: Dict[str, int] = {}
         for cell in ws[header_row]:
             if cell.value and isinstance(cell.value, str):
-                if column_name_upper in cell.value.upper():
-                    return cell.column
-        return None
+                header_upper = cell.value.upper()
+                for name in _WRITABLE_COLUMNS:
+                    if name not in columns and name in header_upper:
+                        columns[name] = cell.column
+        return columns
 
     def save(self) -> bool:
         """
@@ -200,13 +359,37 @@ class ExcelWriter:
             return True
 
         try:
-            self.workbook.save(self.workbook_path)
-            logger.info("Saved changes to %s", self.workbook_path)
+            if self._stream is None:
+                self.workbook.save(self.workbook_path)
+            else:
+                self._stream.seek(0)
+                self._stream.truncate()
+                self.workbook.save(self._stream)
+            logger.info("Saved changes to %s", self.workbook_path or "stream")
             return True
         except Exception:
             logger.exception("Error saving workbook")
             return False
 
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the workbook in memory, as save() would write it to disk.
+
+        For callers that want the updated file's contents rather than the file
+        (use with contextlib.closing so nothing is also written to disk).
+
+        Returns:
+            The .xlsx file contents; the original file's bytes if unmodified
+        """
+        if not self.modified:
+            if self._stream is None:
+                return self.workbook_path.read_bytes()
+            self._stream.seek(0)
+            return self._stream.read()
+        buffer = io.BytesIO()
+        self.workbook.save(buffer)
+        return buffer.getvalue()
+
     def close(self):
         """Close the workbook."""
         if self.workbook:
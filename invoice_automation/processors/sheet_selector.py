@@ -2,6 +2,7 @@
 Sheet selector for mapping suppliers to Excel sheets.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 
@@ -28,10 +29,14 @@ class SheetSelector:
     }
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def get_sheet_name(supplier_type: str) -> Optional[str]:
         """
         Get the sheet name for a given supplier type.
 
+        Memoized: there are only a handful of supplier types, and
+        SUPPLIER_SHEET_MAP is never modified at runtime.
+
         Args:
             supplier_type: Supplier type (e.g., 'AAW', 'CJL')
 
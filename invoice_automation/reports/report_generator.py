@@ -2,8 +2,10 @@
 Report generator for invoice processing results.
 """
 
+import csv
+import io
 from pathlib import Path
-from typing import List
+from typing import List, TextIO
 from datetime import datetime
 
 from ..models import ValidationResult
@@ -71,6 +73,17 @@ class ReportGenerator:
 
         return "\n".join(summary)
 
+    def summary_csv(self) -> str:
+        """
+        Build the summary report as CSV text (what save_summary_csv writes).
+
+        Returns:
+            CSV text
+        """
+        buffer = io.StringIO(newline="")
+        self._write_summary_csv(buffer)
+        return buffer.getvalue()
+
     def save_summary_csv(self, output_path: Path):
         """
         Save summary report as CSV.
@@ -78,46 +91,42 @@ class ReportGenerator:
         Args:
             output_path: Path to save CSV file
         """
-        import csv
-
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "Status",
-                    "Invoice Number",
-                    "Supplier",
-                    "PO Number",
-                    "Store",
-                    "Amount",
-                    "Validations",
-                    "Errors",
-                ]
-            )
+            self._write_summary_csv(f)
+
+    def _write_summary_csv(self, f: TextIO) -> None:
+        """Write the summary CSV header and rows to an open text stream."""
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "Status",
+                "Invoice Number",
+                "Supplier",
+                "PO Number",
+                "Store",
+                "Amount",
+                "Validations",
+                "Errors",
+            ]
+        )
 
-            for result in self.results:
-                if result.invoice:
-                    status = result.get_status_summary()
-                    inv_num = result.invoice.invoice_number
-                    supplier = result.invoice.supplier_name
-                    po_num = result.invoice.po_number
-                    store = result.invoice.store_location
-                    amount = f"£{result.invoice.net_amount:.2f}"
-                    validations = f"{sum(1 for v in result.validations if v.passed)}/{len(result.validations)} passed"
-                    errors = "; ".join(result.errors)
-
-                    writer.writerow(
-                        [
-                            status,
-                            inv_num,
-                            supplier,
-                            po_num,
-                            store,
-                            amount,
-                            validations,
-                            errors,
-                        ]
-                    )
+        writer.writerows(self._summary_rows())
+
+    def _summary_rows(self):
+        """Yield one CSV row per extracted invoice (failed PDFs have none)."""
+        for result in self.results:
+            if result.invoice:
+                passed = sum(1 for v in result.validations if v.passed)
+                yield [
+                    result.get_status_summary(),
+                    result.invoice.invoice_number,
+                    result.invoice.supplier_name,
+                    result.invoice.po_number,
+                    result.invoice.store_location,
+                    f"£{result.invoice.net_amount:.2f}",
+                    f"{passed}/{len(result.validations)} passed",
+                    "; ".join(result.errors),
+                ]
 
     def save_detailed_report(self, output_path: Path):
         """
@@ -126,6 +135,16 @@ class ReportGenerator:
         Args:
             output_path: Path to save report file
         """
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(self.detailed_report())
+
+    def detailed_report(self) -> str:
+        """
+        Build the detailed validation report text (what save_detailed_report writes).
+
+        Returns:
+            Report text
+        """
         lines = []
         lines.append(
             f"Invoice Processing Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
@@ -168,5 +187,4 @@ class ReportGenerator:
 
             lines.append("")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        return "\n".join(lines)
@@ -6,6 +6,9 @@ from decimal import Decimal, InvalidOperation
 from typing import Optional
 import re
 
+# First number in a cleaned amount string, with up to two decimal places
+_AMOUNT_RE = re.compile(r"(\d+(?:\.\d{1,2})?)")
+
 
 class AmountParser:
     """Utility class for parsing currency amounts."""
@@ -41,7 +44,7 @@ class AmountParser:
         amount_str = amount_str.replace(",", "")
 
         # Try to extract amount using regex
-        match = re.search(r"(\d+(?:\.\d{1,2})?)", amount_str)
+        match = _AMOUNT_RE.search(amount_str)
         if match:
             try:
                 return Decimal(match.group(1))
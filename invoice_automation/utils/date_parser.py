@@ -8,28 +8,76 @@ import re
 from dateutil import parser as dateutil_parser
 
 
+_MONTHS = {
+    name: number
+    for number, full in enumerate(
+        (
+            "January", "February", "March", "April", "May", "June", "July",
+            "August", "September", "October", "November", "December",
+        ),
+        start=1,
+    )
+    for name in (full, full[:3])
+}
+
+
+def _two_digit_year(yy: str) -> int:
+    """Expand a 2-digit year the way strptime's %y does (69-99 -> 1900s)."""
+    year = int(yy)
+    return year + (1900 if year >= 69 else 2000)
+
+
+def _day_first_numeric(match: re.Match) -> datetime:
+    """DD/MM/YYYY, falling back to dateutil for values like 03/25/2025."""
+    try:
+        return datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+    except ValueError:
+        return dateutil_parser.parse(match.group(0), dayfirst=True)
+
+
 class DateParser:
     """Utility class for parsing dates in various formats."""
 
-    # Common date patterns found in invoices
+    # Common date patterns found in invoices, compiled once at import. Each
+    # builder turns the captured groups straight into a datetime (raising
+    # ValueError for impossible dates) instead of re-parsing the matched
+    # text with strptime or dateutil.
     DATE_PATTERNS = [
         # DD Month YYYY (e.g., "08 May 2025", "3 April 2025")
         (
-            r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",
-            "%d %B %Y",
+            re.compile(
+                r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})"
+            ),
+            lambda m: datetime(int(m.group(3)), _MONTHS[m.group(2)], int(m.group(1))),
         ),
         (
-            r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})",
-            "%d %b %Y",
+            re.compile(
+                r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})"
+            ),
+            lambda m: datetime(int(m.group(3)), _MONTHS[m.group(2)], int(m.group(1))),
         ),
         # DD/MM/YYYY or DD-MM-YYYY
-        (r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})", None),  # Will use dateutil
+        (re.compile(r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})"), _day_first_numeric),
         # DD.MM.YY (e.g., "07.05.25")
-        (r"(\d{1,2})\.(\d{1,2})\.(\d{2})", "%d.%m.%y"),
+        (
+            re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{2})"),
+            lambda m: datetime(
+                _two_digit_year(m.group(3)), int(m.group(2)), int(m.group(1))
+            ),
+        ),
         # YYYY-MM-DD (ISO format)
-        (r"(\d{4})-(\d{1,2})-(\d{1,2})", "%Y-%m-%d"),
+        (
+            re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})"),
+            lambda m: datetime(int(m.group(1)), int(m.group(2)), int(m.group(3))),
+        ),
     ]
 
+    # Every DATE_PATTERNS entry as one alternation (group "p<i>" is entry i),
+    # so a string is checked against all of them in a single scan.
+    _ANY_DATE = re.compile(
+        "|".join(f"(?P<p{i}>{p.pattern})" for i, (p, _) in enumerate(DATE_PATTERNS))
+    )
+
     @staticmethod
     def parse_date(date_str: str) -> Optional[datetime]:
         """
@@ -54,18 +102,28 @@ class DateParser:
         # Clean the string
         date_str = date_str.strip()
 
+        # Find the first date-like text with one scan, then start trying
+        # patterns from the one that matched it. Patterns are tried in
+        # priority order, so a higher-priority pattern that matches further
+        # along the string must still win; only then are all patterns tried.
+        patterns = DateParser.DATE_PATTERNS
+        hit = DateParser._ANY_DATE.search(date_str)
+        if hit is None:
+            patterns = []
+        else:
+            first = int(hit.lastgroup[1:])
+            if not any(
+                p.search(date_str, hit.start() + 1) for p, _ in patterns[:first]
+            ):
+                patterns = patterns[first:]
+
         # Try each pattern
-        for pattern, date_format in DateParser.DATE_PATTERNS:
-            match = re.search(pattern, date_str)
+        for pattern, build in patterns:
+            match = pattern.search(date_str)
             if match:
                 try:
-                    if date_format:
-                        # Use strptime with specific format
-                        return datetime.strptime(match.group(0), date_format)
-                    else:
-                        # Use dateutil parser for flexible parsing
-                        return dateutil_parser.parse(match.group(0), dayfirst=True)
-                except (ValueError, TypeError):
+                    return build(match)
+                except (ValueError, TypeError, OverflowError):
                     continue
 
         # Fallback: try dateutil parser directly
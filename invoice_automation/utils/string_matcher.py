@@ -2,9 +2,54 @@
 String matching utilities for fuzzy matching and pattern extraction.
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence
 import re
-from fuzzywuzzy import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+# Patterns compiled once at import rather than looked up per call
+_MENKIND_STORE_RE = re.compile(r"Menkind Limited\s*-\s*([^-\n]+)", re.IGNORECASE)
+_SITE_RE = re.compile(r"Site:\s*([^\n]+)", re.IGNORECASE)
+_MENKIND_RE = re.compile(r"Menkind Limited", re.IGNORECASE)
+
+# Punctuation normalize_string turns into spaces (a plain character mapping,
+# so str.translate does it without the regex engine)
+_PUNCT_TABLE = str.maketrans({c: " " for c in ",.-_/\\"})
+
+# Characters that mean an ASCII string still needs normalizing: the
+# punctuation above plus whitespace other than a plain space
+_NOT_NORMALIZED = frozenset(",.-_/\\\t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+
+
+@lru_cache(maxsize=4096)
+def _normalize(s: str) -> str:
+    """Cached body of StringMatcher.normalize_string.
+
+    Fuzzy PO matching scores every row's store and company name against each
+    invoice, so the same few hundred sheet values are normalized repeatedly.
+    """
+    # Already normalized (lowercase ASCII, no punctuation, single spaces):
+    # nothing to do. Checked inside the cache, so cache hits don't pay for it.
+    if (
+        s.isascii()
+        and s.islower()
+        and _NOT_NORMALIZED.isdisjoint(s)
+        and "  " not in s
+        and s[0] != " "
+        and s[-1] != " "
+    ):
+        return s
+
+    # Convert to lowercase
+    s = s.lower()
+
+    # Remove common punctuation
+    s = s.translate(_PUNCT_TABLE)
+
+    # Remove extra whitespace
+    return " ".join(s.split())
 
 
 class StringMatcher:
@@ -29,8 +74,43 @@ class StringMatcher:
         s1_norm = StringMatcher.normalize_string(s1)
         s2_norm = StringMatcher.normalize_string(s2)
 
-        # Calculate similarity score
-        return fuzz.token_sort_ratio(s1_norm, s2_norm)
+        # Calculate similarity score. default_process mirrors fuzzywuzzy's
+        # full_process (lowercase, strip non-alphanumerics) and rounding keeps
+        # the integer scores the match thresholds were tuned against.
+        return int(
+            round(fuzz.token_sort_ratio(s1_norm, s2_norm, processor=default_process))
+        )
+
+    @staticmethod
+    def fuzzy_match_scores(s: str, choices: Sequence[Optional[str]]) -> List[int]:
+        """
+        Score one string against many choices in a single call.
+
+        Equivalent to calling fuzzy_match_score(s, choice) for each choice,
+        but the query is normalized once and the scoring loop runs inside
+        rapidfuzz rather than in Python.
+
+        Args:
+            s: String to match
+            choices: Candidate strings (None/empty entries score 0)
+
+        Returns:
+            Similarity scores (0-100), one per choice
+        """
+        if not s or not choices:
+            return [0] * len(choices)
+
+        query = StringMatcher.normalize_string(s)
+        normalized = [StringMatcher.normalize_string(c) if c else "" for c in choices]
+        # float64 so rounding matches fuzzy_match_score exactly
+        scores = process.cdist(
+            [query],
+            normalized,
+            scorer=fuzz.token_sort_ratio,
+            processor=default_process,
+            dtype=np.float64,
+        )[0]
+        return [int(round(score)) if c else 0 for score, c in zip(scores, choices)]
 
     @staticmethod
     def normalize_string(s: str) -> str:
@@ -48,16 +128,7 @@ class StringMatcher:
         if not s:
             return ""
 
-        # Convert to lowercase
-        s = s.lower()
-
-        # Remove common punctuation
-        s = re.sub(r"[,.\-_/\\]", " ", s)
-
-        # Remove extra whitespace
-        s = " ".join(s.split())
-
-        return s
+        return _normalize(s)
 
     @staticmethod
     def extract_store_name(address: str) -> Optional[str]:
@@ -79,28 +150,28 @@ class StringMatcher:
             return None
 
         # Pattern 1: "Menkind Limited - StoreName - ..."
-        match = re.search(r"Menkind Limited\s*-\s*([^-\n]+)", address, re.IGNORECASE)
+        match = _MENKIND_STORE_RE.search(address)
         if match:
             return match.group(1).strip()
 
         # Pattern 2: "Site: StoreName"
-        match = re.search(r"Site:\s*([^\n]+)", address, re.IGNORECASE)
+        match = _SITE_RE.search(address)
         if match:
             store_part = match.group(1).strip()
             # Remove trailing address parts
             if "-" in store_part:
-                return store_part.split("-")[0].strip()
+                return store_part.partition("-")[0].strip()
             return store_part
 
         # Pattern 3: Look for common UK location names
         # Extract first line or first significant part
-        lines = address.split("\n")
-        if lines:
-            first_line = lines[0].strip()
-            # Remove company name if present
-            first_line = re.sub(r"Menkind Limited", "", first_line, flags=re.IGNORECASE)
-            first_line = first_line.strip("-,. ")
-            if first_line:
-                return first_line
+        # (partition stops at the first newline instead of splitting the
+        # whole address, which can be an entire page of invoice text)
+        first_line = address.partition("\n")[0].strip()
+        # Remove company name if present
+        first_line = _MENKIND_RE.sub("", first_line)
+        first_line = first_line.strip("-,. ")
+        if first_line:
+            return first_line
 
         return None
@@ -33,6 +33,17 @@ SUPPLIER_REGISTRY: list[tuple[list[str], list[str], str, str]] = [
     (["aura"], [], "Aura Air Conditioning", "AURA"),
 ]
 
+# The registry flattened at import into one (marker, checks_filename, result)
+# tuple per marker, in registry order, so identification is a single flat
+# loop. Order is what makes "first match wins" hold: each entry's text
+# markers, then its filename markers, before the next entry's.
+_MARKERS: tuple[tuple[str, bool, tuple[str, str]], ...] = tuple(
+    (marker, checks_filename, (name, stype))
+    for text_markers, filename_markers, name, stype in SUPPLIER_REGISTRY
+    for checks_filename, markers in ((False, text_markers), (True, filename_markers))
+    for marker in markers
+)
+
 
 def identify_supplier(text: str, filename: str = "") -> tuple[str, str]:
     """
@@ -45,12 +56,8 @@ def identify_supplier(text: str, filename: str = "") -> tuple[str, str]:
     text_lower = text.lower()
     filename_lower = filename.lower()
 
-    for text_markers, filename_markers, name, stype in SUPPLIER_REGISTRY:
-        for marker in text_markers:
-            if marker in text_lower:
-                return name, stype
-        for marker in filename_markers:
-            if marker in filename_lower:
-                return name, stype
+    for marker, checks_filename, result in _MARKERS:
+        if marker in (filename_lower if checks_filename else text_lower):
+            return result
 
     return "Unknown Supplier", "GENERIC"
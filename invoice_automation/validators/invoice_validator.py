@@ -34,8 +34,15 @@ class InvoiceValidator:
         self.po_matcher = POMatcher(excel_reader)
         self.quote_validator = QuoteValidator(threshold=quote_threshold)
 
-        # Load reference data
-        self.po_matcher.load_sheets()
+        # Reference data is loaded on the first validate() call, so building a
+        # validator doesn't parse every maintenance sheet up front.
+        self._sheets_loaded = False
+
+    def _ensure_loaded(self) -> None:
+        """Load the maintenance sheets the first time they are needed."""
+        if not self._sheets_loaded:
+            self.po_matcher.load_sheets()
+            self._sheets_loaded = True
 
     def validate(self, invoice: Invoice) -> ValidationResult:
         """
@@ -55,6 +62,8 @@ class InvoiceValidator:
         Returns:
             ValidationResult with all checks performed
         """
+        self._ensure_loaded()
+
         result = ValidationResult(
             invoice=invoice, po_record=None, pdf_path=invoice.pdf_path
         )
@@ -95,6 +104,9 @@ class InvoiceValidator:
     AMOUNT_TOLERANCE_PCT = Decimal("0.01")
     AMOUNT_TOLERANCE_ABS = Decimal("0.50")
 
+    # Net amounts above this are unusual enough to warn about.
+    LARGE_AMOUNT_THRESHOLD = Decimal("10000")
+
     def _validate_amounts(
         self, invoice: Invoice, po_record: Optional[PORecord]
     ) -> List[Validation]:
@@ -106,29 +118,30 @@ class InvoiceValidator:
         confirm) — see ValidationResult.needs_review.
         """
         validations: List[Validation] = []
+        net, vat, total = invoice.net_amount, invoice.vat_amount, invoice.total_amount
 
-        if invoice.net_amount <= 0:
+        if net <= 0:
             validations.append(
                 Validation(
                     check_name="Amount Validation",
                     passed=False,
                     expected="Positive amount",
-                    actual=f"£{invoice.net_amount}",
+                    actual=f"£{net}",
                     severity=ValidationSeverity.ERROR,
-                    message=f"Extracted net amount is £{invoice.net_amount} which is invalid. Check the PDF — the amount may not have been read correctly.",
+                    message=f"Extracted net amount is £{net} which is invalid. Check the PDF — the amount may not have been read correctly.",
                 )
             )
             return validations
 
-        if invoice.net_amount > Decimal("10000"):
+        if net > self.LARGE_AMOUNT_THRESHOLD:
             validations.append(
                 Validation(
                     check_name="Amount Validation",
                     passed=True,
                     expected="Amount under £10,000",
-                    actual=f"£{invoice.net_amount}",
+                    actual=f"£{net}",
                     severity=ValidationSeverity.WARNING,
-                    message=f"High amount: £{invoice.net_amount} (exceeds £10,000 - please verify)",
+                    message=f"High amount: £{net} (exceeds £10,000 - please verify)",
                 )
             )
         else:
@@ -137,27 +150,27 @@ class InvoiceValidator:
                     check_name="Amount Validation",
                     passed=True,
                     expected="Valid amount",
-                    actual=f"£{invoice.net_amount}",
+                    actual=f"£{net}",
                     severity=ValidationSeverity.INFO,
-                    message=f"Amount validated: £{invoice.net_amount}",
+                    message=f"Amount validated: £{net}",
                 )
             )
 
         # Internal consistency: net + VAT should equal total. Only checked when
         # all three were independently extracted (>0); a 0 VAT/total means the
         # field wasn't read, so there is nothing reliable to reconcile against.
-        net, vat, total = invoice.net_amount, invoice.vat_amount, invoice.total_amount
         if net > 0 and vat > 0 and total > 0:
-            diff = abs((net + vat) - total)
+            net_plus_vat = net + vat
+            diff = abs(net_plus_vat - total)
             if diff > max(self.AMOUNT_TOLERANCE_ABS, total * self.AMOUNT_TOLERANCE_PCT):
                 validations.append(
                     Validation(
                         check_name="Amount Reconciliation",
                         passed=False,
-                        expected=f"net + VAT = total (£{net} + £{vat} = £{net + vat})",
+                        expected=f"net + VAT = total (£{net} + £{vat} = £{net_plus_vat})",
                         actual=f"total £{total} (off by £{diff})",
                         severity=ValidationSeverity.ERROR,
-                        message=f"Amounts don't reconcile: net £{net} + VAT £{vat} = £{net + vat}, but total reads £{total}. Likely a mis-read amount — please verify before posting.",
+                        message=f"Amounts don't reconcile: net £{net} + VAT £{vat} = £{net_plus_vat}, but total reads £{total}. Likely a mis-read amount — please verify before posting.",
                     )
                 )
 
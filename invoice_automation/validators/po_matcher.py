@@ -93,13 +93,11 @@ class POMatcher:
                 self._add_post_match_validations(invoice, po_record, validations)
                 return po_record, validations
 
-        candidates = self.excel_reader.find_po_candidates(sheet_name, invoice)
-
         # If the invoice states a PO but neither the exact-PO search (Strategy 1)
         # nor the invoice-number search (Strategy 2) found it, report it as NOT
         # FOUND. We deliberately do not fuzzy-match to a *different* PO here —
-        # guessing a different order risks invoicing against the wrong PO. Closest
-        # candidates are shown only as a hint for manual lookup.
+        # guessing a different order risks invoicing against the wrong PO, so
+        # the fuzzy candidate scan is skipped entirely.
         if invoice.has_po:
             validations.append(
                 Validation(
@@ -117,7 +115,9 @@ class POMatcher:
             return None, validations
 
         # Strategy 3: Fuzzy multi-field match — only for invoices with NO PO of
-        # their own (scored on store + supplier + amount).
+        # their own (scored on store + supplier + amount). Only the best
+        # candidate is used.
+        candidates = self.excel_reader.find_po_candidates(sheet_name, invoice, limit=1)
         if not candidates:
             validations.append(
                 Validation(
@@ -18,6 +18,8 @@ class QuoteValidator:
             threshold: Amount threshold requiring quote authorization (default £200)
         """
         self.threshold = threshold
+        # Formatted once; every below-threshold result quotes it twice
+        self._threshold_text = f"£{threshold:.2f}"
 
     def validate(self, invoice: Invoice, po_record: PORecord) -> Validation:
         """
@@ -54,13 +56,14 @@ class QuoteValidator:
         # Check if invoice amount exceeds threshold
         if invoice.net_amount <= self.threshold:
             # No authorization required
+            amount_text = f"£{invoice.net_amount:.2f}"
             return Validation(
                 check_name="Quote Authorization (£200+ Check)",
                 passed=True,
                 expected="No authorization required",
-                actual=f"Amount £{invoice.net_amount:.2f} ≤ £{self.threshold:.2f}",
+                actual=f"Amount {amount_text} ≤ {self._threshold_text}",
                 severity=ValidationSeverity.INFO,
-                message=f"Invoice amount £{invoice.net_amount:.2f} is below £{self.threshold:.2f} threshold - no quote authorization required",
+                message=f"Invoice amount {amount_text} is below {self._threshold_text} threshold - no quote authorization required",
             )
 
         # Amount is over threshold - check authorization
@@ -0,0 +1,59 @@
+"""Regression tests for DateParser.
+
+Pins the date formats seen on real invoices, including the edge cases the
+pattern builders must handle the same way strptime/dateutil did: 2-digit year
+expansion, impossible dates falling through, and month-first numeric dates.
+
+Run directly (no pytest needed):
+    .venv/Scripts/python.exe -m tests.test_date_parser
+"""
+
+from datetime import datetime
+
+from invoice_automation.utils import DateParser
+
+
+def test_month_name_formats():
+    assert DateParser.parse_date("08 May 2025") == datetime(2025, 5, 8)
+    assert DateParser.parse_date("Date: 3 Apr 2025") == datetime(2025, 4, 3)
+
+
+def test_numeric_formats_are_day_first():
+    assert DateParser.parse_date("12/03/2025") == datetime(2025, 3, 12)
+    assert DateParser.parse_date("2025-03-15") == datetime(2025, 3, 15)
+    # Day > 12 in the second slot: dateutil's month-first fallback
+    assert DateParser.parse_date("03/25/2025") == datetime(2025, 3, 25)
+
+
+def test_two_digit_year_follows_strptime_pivot():
+    assert DateParser.parse_date("07.05.25") == datetime(2025, 5, 7)
+    assert DateParser.parse_date("07.05.70") == datetime(1970, 5, 7)
+
+
+def test_impossible_date_falls_through():
+    assert DateParser.parse_date("31 Feb 2025") is None
+    assert DateParser.parse_date("not a date") is None
+
+
+def test_pattern_priority_beats_position():
+    # "DD Month YYYY" outranks ISO even when the ISO date comes first.
+    assert DateParser.parse_date("2025-01-01 / 5 Dec 2024") == datetime(2024, 12, 5)
+
+
+if __name__ == "__main__":
+    import sys
+
+    failures = 0
+    for _name, _fn in sorted(globals().items()):
+        if _name.startswith("test_") and callable(_fn):
+            try:
+                _fn()
+                print(f"PASS {_name}")
+            except AssertionError as exc:
+                failures += 1
+                print(f"FAIL {_name}: {exc}")
+            except Exception as exc:
+                failures += 1
+                print(f"ERROR {_name}: {type(exc).__name__}: {exc}")
+    print(f"\n{failures} failure(s)")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,166 @@
+"""Regression tests for writing invoice details back to the PO workbook.
+
+Builds a small .xlsx fixture (header below title rows, like the real
+Maintenance PO workbook) and checks that ExcelWriter writes the invoice
+number/amount/signed date into the right row and columns, only fills an empty
+nominal code, guards against formula injection, and highlights the row.
+
+Run directly (no pytest needed):
+    .venv/Scripts/python.exe -m tests.test_excel_writer
+"""
+
+import io
+import tempfile
+from contextlib import closing
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import openpyxl
+
+from invoice_automation.processors import ExcelWriter, PORecordUpdate
+
+_HEADER = ["PO", "STORE", "INVOICE NO.\n", "INVOICE AMOUNT (EX VAT)",
+           "INVOICE SIGNED", "NOMINAL CODE"]
+
+
+def _workbook() -> Path:
+    path = Path(tempfile.mkdtemp()) / "wb.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "OTHER"
+    for _ in range(4):  # title/legend rows before the header (header at row 5)
+        ws.append(["Maintenance - PO's & Outstanding"])
+    ws.append(_HEADER)
+    ws.append(["OT0402", "Trafford", None, None, None, None])
+    ws.append(["OT0403", "Aberdeen", None, None, None, "7820"])
+    wb.save(path)
+    return path
+
+
+def _update(path: Path, row_index: int, invoice_number: str = "INV-1",
+            nominal_code: str = "7830") -> bool:
+    with ExcelWriter(path, create_backup=False) as writer:
+        return writer.update_po_record(
+            "OTHER", row_index, invoice_number, Decimal("115.50"),
+            datetime(2026, 4, 1), nominal_code=nominal_code,
+        )
+
+
+def test_writes_invoice_fields_to_data_row():
+    path = _workbook()
+    assert _update(path, 0)
+    ws = openpyxl.load_workbook(path)["OTHER"]
+    assert [ws.cell(row=6, column=c).value for c in (3, 4, 6)] == [
+        "INV-1", 115.5, "7830"
+    ]
+    assert ws.cell(row=6, column=5).value == datetime(2026, 4, 1)
+
+
+def test_existing_nominal_code_is_kept():
+    path = _workbook()
+    assert _update(path, 1)
+    assert openpyxl.load_workbook(path)["OTHER"].cell(row=7, column=6).value == "7820"
+
+
+def test_formula_like_invoice_number_is_neutralised():
+    path = _workbook()
+    assert _update(path, 0, invoice_number="=HYPERLINK(\"x\")")
+    value = openpyxl.load_workbook(path)["OTHER"].cell(row=6, column=3).value
+    assert value.startswith("'=")
+
+
+def test_updated_row_is_highlighted():
+    path = _workbook()
+    assert _update(path, 0)
+    ws = openpyxl.load_workbook(path)["OTHER"]
+    assert ws.cell(row=6, column=1).fill.fgColor.rgb.endswith("DAEEF3")
+    assert ws.cell(row=7, column=1).fill.fill_type is None
+
+
+def test_highlight_shares_one_fill_style():
+    path = _workbook()
+    with ExcelWriter(path, create_backup=False) as writer:
+        fills_before = len(writer.workbook._fills)
+        writer.update_po_records([
+            PORecordUpdate("OTHER", i, f"INV-{i}", Decimal("1"), datetime(2026, 4, 1))
+            for i in (0, 1)
+        ])
+        assert len(writer.workbook._fills) == fills_before + 1
+
+
+def test_backup_keeps_original_contents_after_save():
+    path = _workbook()
+    original = path.read_bytes()
+    with ExcelWriter(path) as writer:
+        writer.update_po_record(
+            "OTHER", 0, "INV-1", Decimal("1"), datetime(2026, 4, 1)
+        )
+    assert path.with_suffix(".backup.xlsx").read_bytes() == original
+    assert path.read_bytes() != original
+
+
+def test_to_bytes_serializes_updates_without_touching_disk():
+    path = _workbook()
+    original = path.read_bytes()
+    with closing(ExcelWriter(path, create_backup=False)) as writer:
+        assert writer.to_bytes() == original  # nothing modified yet
+        writer.update_po_record(
+            "OTHER", 0, "INV-1", Decimal("1"), datetime(2026, 4, 1)
+        )
+        data = writer.to_bytes()
+    assert path.read_bytes() == original
+    ws = openpyxl.load_workbook(io.BytesIO(data))["OTHER"]
+    assert ws.cell(row=6, column=3).value == "INV-1"
+
+
+def test_stream_workbook_is_saved_back_into_the_stream():
+    buffer = io.BytesIO(_workbook().read_bytes())
+    with ExcelWriter(buffer) as writer:  # no backup is made for a stream
+        assert writer.update_po_record(
+            "OTHER", 1, "INV-9", Decimal("1"), datetime(2026, 4, 1)
+        )
+    ws = openpyxl.load_workbook(io.BytesIO(buffer.getvalue()))["OTHER"]
+    assert ws.cell(row=7, column=3).value == "INV-9"
+
+
+def test_unknown_sheet_returns_false():
+    path = _workbook()
+    with ExcelWriter(path, create_backup=False) as writer:
+        assert not writer.update_po_record(
+            "NOPE", 0, "INV-1", Decimal("1"), datetime(2026, 4, 1)
+        )
+
+
+def test_batch_update_skips_unknown_sheet_and_applies_rest():
+    path = _workbook()
+    signed = datetime(2026, 4, 1)
+    with ExcelWriter(path, create_backup=False) as writer:
+        updated = writer.update_po_records([
+            PORecordUpdate("OTHER", 0, "INV-1", Decimal("10"), signed),
+            PORecordUpdate("NOPE", 0, "INV-2", Decimal("20"), signed),
+            PORecordUpdate("OTHER", 1, "INV-3", 30.0, signed),
+        ])
+    assert updated == 2
+    ws = openpyxl.load_workbook(path)["OTHER"]
+    assert [ws.cell(row=r, column=3).value for r in (6, 7)] == ["INV-1", "INV-3"]
+    assert [ws.cell(row=r, column=4).value for r in (6, 7)] == [10.0, 30.0]
+
+
+if __name__ == "__main__":
+    import sys
+
+    failures = 0
+    for _name, _fn in sorted(globals().items()):
+        if _name.startswith("test_") and callable(_fn):
+            try:
+                _fn()
+                print(f"PASS {_name}")
+            except AssertionError as exc:
+                failures += 1
+                print(f"FAIL {_name}: {exc}")
+            except Exception as exc:
+                failures += 1
+                print(f"ERROR {_name}: {type(exc).__name__}: {exc}")
+    print(f"\n{failures} failure(s)")
+    sys.exit(1 if failures else 0)
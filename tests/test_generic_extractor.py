@@ -9,6 +9,8 @@ Run directly (no pytest needed):
 or under pytest if/when it is added.
 """
 
+from pathlib import Path
+
 from invoice_automation.extractors.generic_extractor import GenericExtractor
 
 
@@ -162,6 +164,13 @@ def test_po_order_number_without_prefix():
     assert _po("Order number LUX010") == "LUX010"
 
 
+def test_po_pattern_priority_beats_position():
+    # No PO field: known PO codes anywhere in the text are tried in
+    # PO_PATTERNS order, so "OT" wins even though "PO" appears first.
+    assert _po("Ref PO12345 see also OT0402") == "OT0402"
+    assert _po("Ref PO12345 only") == "PO12345"
+
+
 def _total(text: str) -> str:
     return str(GenericExtractor()._extract_total_amount(text))
 
@@ -173,6 +182,15 @@ def test_total_with_corrupted_pound_glyph():
     assert _total(text) == "1212.00"
 
 
+def test_extract_uses_supplied_text_without_opening_pdf():
+    # The caller already read the PDF; the path is only used for its name.
+    text = "Invoice No: 4471\nOrder number LUX010\nSUB TOTAL 100.00\nVAT 20.00\nINVOICE TOTAL 120.00"
+    invoice = GenericExtractor().extract(Path("missing.pdf"), text)
+    assert invoice.invoice_number == "4471"
+    assert invoice.po_number == "LUX010"
+    assert str(invoice.total_amount) == "120.00"
+
+
 if __name__ == "__main__":
     import sys
 
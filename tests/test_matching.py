@@ -19,6 +19,7 @@ import openpyxl
 
 from invoice_automation.models import Invoice
 from invoice_automation.processors import ExcelReader
+from invoice_automation.utils import StringMatcher
 from invoice_automation.validators import InvoiceValidator
 from invoice_automation.validators.po_matcher import POMatcher
 
@@ -102,6 +103,27 @@ def test_substring_po_does_not_match_longer_po():
     assert rec is None
 
 
+def test_multiline_po_and_invoice_cells_match_exact_lines():
+    path = Path(tempfile.mkdtemp()) / "wb.xlsx"
+    wb = openpyxl.Workbook()
+    cjl = wb.active
+    cjl.title = "CJL"
+    cjl.append(["Maintenance title"])
+    cjl.append(["PO", "STORE", "INVOICE NO."])
+    cjl.append(["\nCJL408\n", "Leeds", ""])
+    cjl.append(["CJL409\nCJL410", "York", "INV26790\nINV27927"])
+    cjl.append(["CJL410", "Hull", "INV27927"])
+    wb.save(path)
+    reader = ExcelReader(path)
+
+    assert reader.find_po_record("CJL408", "CJL").store == "Leeds"
+    # First row listing the PO / invoice number wins
+    assert reader.find_po_record("cjl410", "CJL").store == "York"
+    assert reader.find_by_invoice_number("inv27927", "CJL").store == "York"
+    assert reader.find_po_record("CJL41", "CJL") is None
+    assert reader.find_by_invoice_number("INV2679", "CJL") is None
+
+
 def test_poless_invoice_fuzzy_goes_to_review_not_auto():
     # No PO on the invoice: fuzzy store/supplier/amount scoring still finds a
     # candidate, but it is a GUESS — it must never auto-update. It lands in
@@ -113,6 +135,16 @@ def test_poless_invoice_fuzzy_goes_to_review_not_auto():
     assert any("NEEDS REVIEW" in e for e in result.errors)
 
 
+def test_po_candidates_limit_keeps_best_first():
+    reader = _reader()
+    invoice = _inv(po="", store="Trafford")
+    everything = reader.find_po_candidates("OTHER", invoice)
+    best = reader.find_po_candidates("OTHER", invoice, limit=1)
+    assert len(best) == 1
+    assert best[0][0].po_number == everything[0][0].po_number == "OT0402"
+    assert best[0][1] == everything[0][1]
+
+
 def test_amount_reconciliation_blocks_auto_update():
     validator = InvoiceValidator(_reader())
     # net + VAT != total -> reviewable, not auto-updated.
@@ -130,6 +162,21 @@ def test_reconciling_amounts_auto_update():
     assert good.can_auto_update
 
 
+def test_fuzzy_match_score_is_integer_and_order_insensitive():
+    # Thresholds (e.g. POMatcher.FUZZY_MATCH_THRESHOLD) were tuned against
+    # fuzzywuzzy's integer token_sort_ratio scores.
+    score = StringMatcher.fuzzy_match_score("Trafford Centre", "centre, TRAFFORD")
+    assert score == 100 and isinstance(score, int)
+    assert StringMatcher.fuzzy_match_score("Trafford", "") == 0
+
+
+def test_batch_fuzzy_scores_match_single_scores():
+    choices = ["Trafford Centre", None, "", "Aberdeen - Union Square", "-"]
+    expected = [StringMatcher.fuzzy_match_score("trafford", c) for c in choices]
+    assert StringMatcher.fuzzy_match_scores("trafford", choices) == expected
+    assert StringMatcher.fuzzy_match_scores("", choices) == [0] * len(choices)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -67,6 +67,19 @@ def test_summary_csv_writes_without_error():
     assert "INV-1" in text
 
 
+def test_in_memory_reports_match_saved_files():
+    rg = ReportGenerator([_result()])
+    with tempfile.TemporaryDirectory() as d:
+        csv_path = Path(d) / "summary.csv"
+        report_path = Path(d) / "report.txt"
+        rg.save_summary_csv(csv_path)
+        rg.save_detailed_report(report_path)
+        assert rg.summary_csv().encode("utf-8") == csv_path.read_bytes()
+        # The report's header carries a timestamp; compare the body only.
+        saved = report_path.read_text(encoding="utf-8").split("\n", 1)[1]
+        assert rg.detailed_report().split("\n", 1)[1] == saved
+
+
 if __name__ == "__main__":
     import sys
 
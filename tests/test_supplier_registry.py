@@ -0,0 +1,54 @@
+"""Regression tests for supplier identification.
+
+Pins the registry's "first match wins" order: entries are checked top to
+bottom, and an entry matches on either its text or its filename markers, so an
+earlier entry's filename marker beats a later entry's text marker.
+
+Run directly (no pytest needed):
+    .venv/Scripts/python.exe -m tests.test_supplier_registry
+"""
+
+from invoice_automation.utils.supplier_registry import identify_supplier
+
+
+def test_text_marker_identifies_supplier():
+    assert identify_supplier("Invoice from SUNBELT Rentals Ltd") == (
+        "Sunbelt Rentals", "SUNBELT"
+    )
+
+
+def test_filename_marker_identifies_supplier():
+    assert identify_supplier("no markers here", "CJL_12345.pdf") == (
+        "CJL Associates", "CJL"
+    )
+
+
+def test_earlier_entry_filename_beats_later_entry_text():
+    assert identify_supplier("Sunbelt Rentals", "aaw_invoice.pdf") == (
+        "AAW National Maintenance", "AAW"
+    )
+
+
+def test_unknown_supplier_falls_back_to_generic():
+    assert identify_supplier("Acme Widgets", "acme.pdf") == (
+        "Unknown Supplier", "GENERIC"
+    )
+
+
+if __name__ == "__main__":
+    import sys
+
+    failures = 0
+    for _name, _fn in sorted(globals().items()):
+        if _name.startswith("test_") and callable(_fn):
+            try:
+                _fn()
+                print(f"PASS {_name}")
+            except AssertionError as exc:
+                failures += 1
+                print(f"FAIL {_name}: {exc}")
+            except Exception as exc:
+                failures += 1
+                print(f"ERROR {_name}: {type(exc).__name__}: {exc}")
+    print(f"\n{failures} failure(s)")
+    sys.exit(1 if failures else 0)
@@ -6,15 +6,20 @@ Simple drag-and-drop interface for invoice processing
 import base64
 import hmac
 import html
+import io
 import json
 import logging
+import shutil
 import tempfile
+import time
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
 import streamlit as st
 
-from invoice_automation.processors import ExcelReader, ExcelWriter
+from invoice_automation.processors import ExcelReader, ExcelWriter, PORecordUpdate
 from invoice_automation.validators import InvoiceValidator
 from invoice_automation.extractors import (
     AAWExtractor,
@@ -23,7 +28,10 @@ from invoice_automation.extractors import (
     APSExtractor,
     GenericExtractor,
 )
-from invoice_automation.extractors.base_extractor import PDFExtractionError
+from invoice_automation.extractors.base_extractor import (
+    PDFExtractionError,
+    read_pdf_pages,
+)
 from invoice_automation.models import ValidationResult
 from invoice_automation.utils.supplier_registry import (
     identify_supplier as identify_supplier_from_text,
@@ -32,7 +40,6 @@ from invoice_automation.utils import store_registry
 from invoice_automation.reports.report_generator import ReportGenerator
 
 logger = logging.getLogger(__name__)
-import pdfplumber
 
 
 # ---------------------------------------------------------------------------
@@ -467,15 +474,37 @@ def inv_note_html(text: str, kind: str = "warning") -> str:
     )
 
 
+def prepare_nominal_rows(rows: list[dict]) -> list[tuple[str, str, str, str]]:
+    """Normalise the supplier→nominal code mapping once per run.
+
+    Returns (code, base_name, base_name_nospace, work_desc) per usable row, in
+    row order, so lookup_nominal_code does no per-row string work per invoice.
+    The base name is the lowercased part of the Supplier field before the
+    first " - "; the work description is the part after it.
+    """
+    prepared = []
+    for row in rows:
+        entry = str(row.get("Supplier", "")).strip()
+        code = str(row.get("Nominal Code", "")).strip()
+        if not entry or not code:
+            continue
+        base, _, desc = entry.lower().partition(" - ")
+        base = base.strip()
+        prepared.append((code, base, base.replace(" ", ""), desc.strip()))
+    return prepared
+
+
 def lookup_nominal_code(
-    supplier_name: str, rows: list[dict], invoice_text: str = ""
+    supplier_name: str, rows: list[tuple[str, str, str, str]], *invoice_texts: str
 ) -> str:
     """Find nominal code for supplier, using invoice text to disambiguate
     when a supplier has multiple codes for different work types.
 
-    The Supplier field in the mapping may contain a work-type suffix after
-    a dash, e.g. "Metro Security (UK) Limited (MetSafe) - safe installation".
-    The base name is the part before the first " - ".
+    ``rows`` comes from prepare_nominal_rows. ``invoice_texts`` (e.g. the
+    description and the raw PDF text) are only joined and lowercased if the
+    work-type scoring below actually needs them. The Supplier field in the
+    mapping may contain a work-type suffix after a dash, e.g.
+    "Metro Security (UK) Limited (MetSafe) - safe installation".
 
     Steps:
     1. Find all rows whose base supplier name matches the invoice supplier.
@@ -489,61 +518,43 @@ def lookup_nominal_code(
         return ""
 
     supplier_lower = supplier_name.lower()
-    invoice_lower = invoice_text.lower() if invoice_text else ""
-
-    def base_name(entry: str) -> str:
-        return entry.split(" - ")[0].strip()
-
-    def work_desc(entry: str) -> str:
-        parts = entry.split(" - ", 1)
-        return parts[1].strip() if len(parts) > 1 else ""
-
-    def name_matches(entry_base: str, supplier: str) -> bool:
-        if entry_base in supplier or supplier in entry_base:
-            return True
-        # Also try with spaces stripped (e.g. "LampShopOnline" vs "lamp shop online")
-        entry_nospace = entry_base.replace(" ", "")
-        supplier_nospace = supplier.replace(" ", "")
-        return entry_nospace in supplier_nospace or supplier_nospace in entry_nospace
+    # Also try with spaces stripped (e.g. "LampShopOnline" vs "lamp shop online")
+    supplier_nospace = supplier_lower.replace(" ", "")
 
     # Collect all matching rows
-    matches = []
-    for row in rows:
-        entry = str(row.get("Supplier", "")).strip()
-        code = str(row.get("Nominal Code", "")).strip()
-        if not entry or not code:
-            continue
-        entry_lower = entry.lower()
-        entry_base = base_name(entry_lower)
-        if name_matches(entry_base, supplier_lower):
-            matches.append((entry_lower, code, work_desc(entry_lower)))
+    matches = [
+        (code, desc)
+        for code, entry_base, entry_nospace, desc in rows
+        if entry_base in supplier_lower
+        or supplier_lower in entry_base
+        or entry_nospace in supplier_nospace
+        or supplier_nospace in entry_nospace
+    ]
 
     if not matches:
         # First-word fallback
         first_word = supplier_lower.split()[0] if supplier_lower.split() else ""
         if first_word and len(first_word) >= 3:
-            for row in rows:
-                entry = str(row.get("Supplier", "")).strip()
-                code = str(row.get("Nominal Code", "")).strip()
-                if not entry or not code:
-                    continue
-                entry_base = base_name(entry.lower())
-                if first_word in entry_base or entry_base.startswith(first_word):
-                    matches.append((entry.lower(), code, work_desc(entry.lower())))
+            matches = [
+                (code, desc)
+                for code, entry_base, _nospace, desc in rows
+                if first_word in entry_base or entry_base.startswith(first_word)
+            ]
         if not matches:
             return ""
 
     # Single match  - return directly
     if len(matches) == 1:
-        return matches[0][1]
+        return matches[0][0]
 
     # Multiple matches  - score by work description overlap with invoice text
+    invoice_lower = " ".join(invoice_texts).lower()
     if not invoice_lower:
-        return matches[0][1]  # No invoice text to compare, return first
+        return matches[0][0]  # No invoice text to compare, return first
 
-    best_code = matches[0][1]
+    best_code = matches[0][0]
     best_score = -1
-    for _entry, code, desc in matches:
+    for code, desc in matches:
         if not desc:
             continue
         words = [w for w in desc.split() if len(w) >= 3]
@@ -558,13 +569,22 @@ def lookup_nominal_code(
 NOMINAL_CODES_PATH = Path(__file__).parent / "data" / "nominal_codes.json"
 
 
+@st.cache_data(show_spinner=False)
+def _parse_nominal_codes(mtime_ns: int, size: int) -> list[dict]:
+    """Parse the mapping file. The arguments are only the cache key: a save
+    changes the file's mtime/size, so the next load re-reads it. cache_data
+    hands each caller its own copy, so sessions can edit their rows freely."""
+    with open(NOMINAL_CODES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_nominal_codes_from_disk() -> list[dict]:
     """Load supplier→nominal code mapping from JSON file."""
     if not NOMINAL_CODES_PATH.exists():
         return []
     try:
-        with open(NOMINAL_CODES_PATH, encoding="utf-8") as f:
-            return json.load(f)
+        stat = NOMINAL_CODES_PATH.stat()
+        return _parse_nominal_codes(stat.st_mtime_ns, stat.st_size)
     except (json.JSONDecodeError, OSError) as exc:
         st.warning(f"Could not load nominal codes: {exc}")
         return []
@@ -572,10 +592,14 @@ def load_nominal_codes_from_disk() -> list[dict]:
 
 def save_nominal_codes_to_disk(rows: list[dict]) -> None:
     """Persist supplier→nominal code mapping to JSON file."""
+    # Written to a temp file then renamed over the original (atomic), so a
+    # crash mid-write can't leave a truncated mapping behind.
+    tmp_path = NOMINAL_CODES_PATH.with_suffix(".json.tmp")
     try:
         NOMINAL_CODES_PATH.parent.mkdir(exist_ok=True)
-        with open(NOMINAL_CODES_PATH, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(rows, f, indent=2)
+        tmp_path.replace(NOMINAL_CODES_PATH)
     except OSError as exc:
         st.error(f"Could not save nominal codes: {exc}")
 
@@ -586,40 +610,65 @@ def identify_supplier(pdf_path: Path, first_page_text: str) -> str:
     return supplier_type
 
 
-def get_extractors():
-    """Build extractor instances.
+# Extractor class for each supplier type; unlisted types use GenericExtractor.
+EXTRACTOR_CLASSES = {
+    "AAW": AAWExtractor,
+    "CJL": CJLExtractor,
+    "AMAZON": AmazonExtractor,
+    "APS": APSExtractor,
+    "COMPCO": GenericExtractor,
+    "GENERIC": GenericExtractor,
+    "SUNBELT": GenericExtractor,
+    "MAXWELL_JONES": GenericExtractor,
+    "METRO_SECURITY": GenericExtractor,
+    "STORE_MAINTENANCE": GenericExtractor,
+    "LAMPSHOP": GenericExtractor,
+    "ILUX": GenericExtractor,
+    "AURA": GenericExtractor,
+}
+
+
+def get_extractor(supplier_type: str, extractors: dict):
+    """Return the extractor for a supplier type, building it on first use.
+
+    ``extractors`` is a cache owned by one processing run, keyed by extractor
+    class, so only the extractors that run's invoices need are ever
+    constructed and every generic-routed supplier shares one GenericExtractor
+    (which holds no per-invoice state).
 
     Deliberately NOT cached with @st.cache_resource: the extractors are cheap to
     construct (a few stateless helpers; compiled regexes are cached at the class
     level in BaseExtractor), and caching them meant code changes to extractors
     did not take effect on redeploy until the app was manually rebooted.
     """
-    return {
-        "AAW": AAWExtractor(),
-        "CJL": CJLExtractor(),
-        "AMAZON": AmazonExtractor(),
-        "APS": APSExtractor(),
-        "COMPCO": GenericExtractor(),
-        "GENERIC": GenericExtractor(),
-        "SUNBELT": GenericExtractor(),
-        "MAXWELL_JONES": GenericExtractor(),
-        "METRO_SECURITY": GenericExtractor(),
-        "STORE_MAINTENANCE": GenericExtractor(),
-        "LAMPSHOP": GenericExtractor(),
-        "ILUX": GenericExtractor(),
-        "AURA": GenericExtractor(),
-    }
+    extractor_class = EXTRACTOR_CLASSES.get(supplier_type, GenericExtractor)
+    extractor = extractors.get(extractor_class)
+    if extractor is None:
+        extractor = extractors[extractor_class] = extractor_class()
+    return extractor
+
+
+def extract_invoice(
+    pdf_path: Path, extractors: dict | None = None, stream: BinaryIO | None = None
+):
+    """Extract invoice from PDF.
 
+    ``stream``, if given, is read instead of ``pdf_path`` (e.g. an upload that
+    is already in memory); the path then only supplies the file name.
 
-def extract_invoice(pdf_path: Path):
-    """Extract invoice from PDF."""
-    with pdfplumber.open(pdf_path) as pdf:
-        first_page_text = pdf.pages[0].extract_text() if pdf.pages else ""
+    Pass the same ``extractors`` cache (see get_extractor) for every PDF in a
+    batch, so each extractor — and the store list a GenericExtractor reads
+    from disk — is built once per run instead of once per PDF.
+
+    The PDF is read once: the first page sniffs the supplier and the full text
+    is handed to the extractor, rather than each opening it with pdfplumber.
+    """
+    page_texts = read_pdf_pages(pdf_path, stream)
+    first_page_text = page_texts[0] if page_texts else ""
 
     supplier_type = identify_supplier(pdf_path, first_page_text)
-    extractors = get_extractors()
-    extractor = extractors.get(supplier_type, extractors["GENERIC"])
-    invoice = extractor.extract(pdf_path)
+    extractor = get_extractor(supplier_type, {} if extractors is None else extractors)
+    invoice = extractor.extract(pdf_path, "\n".join(text for text in page_texts if text))
 
     # Validate the store name for EVERY extractor's output. The generic extractor
     # already validates internally (so this is idempotent for it); the legacy
@@ -631,6 +680,35 @@ def extract_invoice(pdf_path: Path):
     return invoice
 
 
+def process_invoice(
+    pdf_path: Path,
+    validator: InvoiceValidator,
+    extractors: dict | None = None,
+    stream: BinaryIO | None = None,
+) -> ValidationResult:
+    """Extract and validate one PDF, never raising.
+
+    Arguments are as for extract_invoice. A PDF that can't be read, or any
+    unexpected failure, comes back as an error ValidationResult so one bad file
+    doesn't stop the batch.
+    """
+    try:
+        return validator.validate(extract_invoice(pdf_path, extractors, stream))
+    except PDFExtractionError as e:
+        # Expected, user-actionable: the PDF couldn't be parsed.
+        error_msg = f"Could not read '{pdf_path.name}': {e}"
+    except Exception:
+        # Unexpected (bug, pandas/openpyxl error, etc.). Log the full
+        # traceback and surface it as distinct from a read failure so
+        # a code bug isn't silently mislabelled as a bad PDF.
+        logger.exception("Unexpected error processing %s", pdf_path.name)
+        error_msg = (
+            f"Unexpected error processing '{pdf_path.name}' — this is "
+            f"likely a bug, not a bad PDF. Check the server logs."
+        )
+    return ValidationResult.create_error(str(pdf_path), error_msg)
+
+
 # ---------------------------------------------------------------------------
 # Page config + CSS injection
 # ---------------------------------------------------------------------------
@@ -717,20 +795,25 @@ with st.sidebar:
     # persistence is a tracked todo (see tasks/todo.md).
     with st.expander("Supplier Nominal Codes"):
         st.info("To add or change a nominal code, **contact Samuel**.")
-        rows = st.session_state["nominal_mapping_rows"]
-        if rows:
+        # The rows are read-only in the app, so the list HTML is built once per
+        # session instead of every rerun; Reset App clears session_state, which
+        # drops it along with the reloaded rows.
+        if "nominal_list_html" not in st.session_state:
             # Display-only alphabetical sort by supplier (case-insensitive); does
             # not reorder the underlying data, so lookup/matching is unaffected.
             sorted_rows = sorted(
-                rows, key=lambda r: str(r.get("Supplier", "")).lower()
+                st.session_state["nominal_mapping_rows"],
+                key=lambda r: str(r.get("Supplier", "")).lower(),
             )
-            list_html = "".join(
+            st.session_state["nominal_list_html"] = "".join(
                 f'<div style="padding:0.3rem 0;border-bottom:1px solid var(--border-subtle)">'
                 f'<div style="color:var(--text-primary);font-size:0.82rem">{html.escape(str(r["Supplier"]))}</div>'
                 f'<div style="color:var(--text-muted);font-size:0.75rem">{html.escape(str(r["Nominal Code"]))}</div>'
                 f"</div>"
                 for r in sorted_rows
             )
+        list_html = st.session_state["nominal_list_html"]
+        if list_html:
             st.markdown(
                 f'<div style="max-height:260px;overflow-y:auto;border:1px solid var(--border-medium);border-radius:6px;padding:0.4rem 0.6rem">{list_html}</div>',
                 unsafe_allow_html=True,
@@ -823,12 +906,21 @@ shared with any third party.
 # ---------------------------------------------------------------------------
 # Main content
 # ---------------------------------------------------------------------------
-_logo_path = Path(__file__).parent / "assets" / "menkind-logo.jpg"
-if _logo_path.exists():
-    _logo_b64 = base64.b64encode(_logo_path.read_bytes()).decode()
+@st.cache_data(show_spinner=False)
+def _logo_data_url() -> str:
+    """The logo as a data: URL, read and base64-encoded once per process rather
+    than on every rerun ("" if the asset is missing)."""
+    logo_path = Path(__file__).parent / "assets" / "menkind-logo.jpg"
+    if not logo_path.exists():
+        return ""
+    return "data:image/jpeg;base64," + base64.b64encode(logo_path.read_bytes()).decode()
+
+
+_logo_url = _logo_data_url()
+if _logo_url:
     st.markdown(
         f'<div style="display:flex;flex-direction:column;align-items:flex-start;gap:0.5rem;margin-bottom:0.25rem">'
-        f'<img src="data:image/jpeg;base64,{_logo_b64}" '
+        f'<img src="{_logo_url}" '
         f'style="width:52px;height:52px;border-radius:12px;box-shadow:0 2px 8px rgba(0,0,0,0.3)" />'
         f"</div>",
         unsafe_allow_html=True,
@@ -853,19 +945,14 @@ if process_button and all_files_uploaded:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Save uploaded files
-            pdf_dir = temp_path / "invoices"
-            pdf_dir.mkdir()
-
-            for pdf in invoice_pdfs:
-                # Use only the basename of the uploaded filename so it can't
-                # escape the temp directory via path components.
-                pdf_path = pdf_dir / Path(pdf.name).name
-                pdf_path.write_bytes(pdf.read())
+            # Uploaded PDFs are parsed straight from memory. Only the basename
+            # of each upload is kept; a repeated name keeps the last upload.
+            uploads = {Path(pdf.name).name: pdf for pdf in invoice_pdfs}
 
             # Save Excel files
             maintenance_path = temp_path / "maintenance.xlsx"
-            maintenance_path.write_bytes(maintenance_po.read())
+            with open(maintenance_path, "wb") as out:
+                shutil.copyfileobj(maintenance_po, out)
 
             # Initialize components
             excel_reader = ExcelReader(maintenance_path)
@@ -876,35 +963,23 @@ if process_button and all_files_uploaded:
             progress_bar = st.progress(0)
             status_text = st.empty()
 
-            pdf_files = list(pdf_dir.glob("*.pdf"))
-            total_pdfs = len(pdf_files)
-
-            for i, pdf_file in enumerate(pdf_files):
-                status_text.text(f"Processing {pdf_file.name}...")
-                progress_bar.progress((i + 1) / total_pdfs)
-
-                try:
-                    invoice = extract_invoice(pdf_file)
-                    result = validator.validate(invoice)
-                    results.append(result)
-                except PDFExtractionError as e:
-                    # Expected, user-actionable: the PDF couldn't be parsed.
-                    error_msg = f"Could not read '{pdf_file.name}': {e}"
-                    results.append(
-                        ValidationResult.create_error(str(pdf_file), error_msg)
-                    )
-                except Exception:
-                    # Unexpected (bug, pandas/openpyxl error, etc.). Log the full
-                    # traceback and surface it as distinct from a read failure so
-                    # a code bug isn't silently mislabelled as a bad PDF.
-                    logger.exception("Unexpected error processing %s", pdf_file.name)
-                    error_msg = (
-                        f"Unexpected error processing '{pdf_file.name}' — this is "
-                        f"likely a bug, not a bad PDF. Check the server logs."
-                    )
-                    results.append(
-                        ValidationResult.create_error(str(pdf_file), error_msg)
-                    )
+            total_pdfs = len(uploads)
+            extractors = {}  # per-run extractor cache, see get_extractor
+            # Each update is a websocket message; refresh at most every 0.1s
+            # (and always for the last PDF) so quick PDFs don't flood it.
+            last_ui_update = 0.0
+
+            for i, (file_name, upload) in enumerate(uploads.items()):
+                pdf_file = Path(file_name)
+                now = time.monotonic()
+                if now - last_ui_update >= 0.1 or i == total_pdfs - 1:
+                    status_text.text(f"Processing {pdf_file.name}...")
+                    progress_bar.progress((i + 1) / total_pdfs)
+                    last_ui_update = now
+
+                results.append(
+                    process_invoice(pdf_file, validator, extractors, upload)
+                )
 
             progress_bar.empty()
             status_text.empty()
@@ -915,54 +990,57 @@ if process_button and all_files_uploaded:
                 st.warning(sheet_warning)
 
             # Look up nominal codes and warn on misses
-            nominal_rows = st.session_state.get("nominal_mapping_rows", [])
+            nominal_rows = prepare_nominal_rows(
+                st.session_state.get("nominal_mapping_rows", [])
+            )
             for result in results:
                 if result.invoice:
                     inv = result.invoice
                     nom_code = lookup_nominal_code(
                         inv.supplier_name,
                         nominal_rows,
-                        invoice_text=f"{inv.description} {inv.raw_text}",
+                        inv.description,
+                        inv.raw_text,
                     )
                     result.nominal_code = nom_code
                     if not nom_code:
                         result.warnings.append(
                             f"No nominal code mapping for '{inv.supplier_name}'"
                         )
-
-            # Write auto-updated results to Excel
-            with ExcelWriter(maintenance_path, create_backup=False) as writer:
-                for result in results:
-                    if result.can_auto_update:
-                        nom_code = result.nominal_code
-                        writer.update_po_record(
-                            result.po_record.sheet_name,
-                            result.po_record.row_index,
-                            result.invoice.invoice_number,
-                            result.invoice.net_amount,
-                            datetime.now(),
-                            nominal_code=nom_code,
-                        )
-
-            # Read updated Excel into memory (auto-updates applied)
-            with open(maintenance_path, "rb") as f:
-                updated_excel_bytes = f.read()
+                    # The full PDF text was only needed for the lookup above;
+                    # don't keep it alive in session_state for every invoice.
+                    inv.raw_text = ""
+
+            # Auto-updates are only queued here (one signed timestamp per run);
+            # the workbook is written once, together with any confirmed
+            # reviews, when the review column is resolved.
+            signed_at = datetime.now()
+            pending_updates = [
+                PORecordUpdate(
+                    result.po_record.sheet_name,
+                    result.po_record.row_index,
+                    result.invoice.invoice_number,
+                    result.invoice.net_amount,
+                    signed_at,
+                    nominal_code=result.nominal_code,
+                )
+                for result in results
+                if result.can_auto_update
+            ]
 
             # Generate reports
             report_gen = ReportGenerator(results)
             summary = report_gen.generate_summary()
 
-            temp_csv = temp_path / "summary.csv"
-            report_gen.save_summary_csv(temp_csv)
-            csv_content = temp_csv.read_text()
-
-            temp_report = temp_path / "report.txt"
-            report_gen.save_detailed_report(temp_report)
-            report_content = temp_report.read_text()
+            # Built in memory for the download buttons (no temp-file round-trip)
+            csv_content = report_gen.summary_csv()
+            report_content = report_gen.detailed_report()
 
             # Store in session state
             st.session_state["results"] = results
-            st.session_state["updated_excel_bytes"] = updated_excel_bytes
+            st.session_state["workbook_bytes"] = maintenance_po.getvalue()
+            st.session_state["pending_updates"] = pending_updates
+            st.session_state["excel_written"] = False
             st.session_state["csv_content"] = csv_content
             st.session_state["report_content"] = report_content
             st.session_state["processed"] = True
@@ -976,15 +1054,24 @@ if process_button and all_files_uploaded:
 # ---------------------------------------------------------------------------
 # Results -- three-column board layout
 # ---------------------------------------------------------------------------
+def _set_review_decision(idx: int, decision: str) -> None:
+    """Button callback: record a Confirm/Skip decision for review item idx."""
+    st.session_state["review_decisions"][idx] = decision
+
+
 if st.session_state.get("processed"):
     results = st.session_state["results"]
 
-    # Split into 3 buckets
-    auto_results = [r for r in results if r.can_auto_update]
-    review_results = [r for r in results if r.needs_review]
-    failed_results = [
-        r for r in results if not r.can_auto_update and not r.needs_review
-    ]
+    # Split into 3 buckets in one pass (each status is a derived property that
+    # rescans the result's validations, so evaluate it once per result)
+    auto_results, review_results, failed_results = [], [], []
+    for r in results:
+        if r.can_auto_update:
+            auto_results.append(r)
+        elif r.needs_review:
+            review_results.append(r)
+        else:
+            failed_results.append(r)
 
     # Inline metrics
     metrics_html = f"""<div class="inline-metrics">
@@ -1050,20 +1137,26 @@ if st.session_state.get("processed"):
                 for note in (*result.errors, *result.warnings):
                     st.markdown(inv_note_html(note, "warning"), unsafe_allow_html=True)
 
+                # Decisions are recorded in on_click callbacks, which run before
+                # the click's rerun, so the card updates without a second rerun.
                 bc1, bc2 = st.columns(2)
                 with bc1:
-                    if st.button(
+                    st.button(
                         "Confirm Update",
                         key=f"confirm_{idx}",
                         type="primary",
                         use_container_width=True,
-                    ):
-                        st.session_state["review_decisions"][idx] = "confirmed"
-                        st.rerun()
+                        on_click=_set_review_decision,
+                        args=(idx, "confirmed"),
+                    )
                 with bc2:
-                    if st.button("Skip", key=f"skip_{idx}", use_container_width=True):
-                        st.session_state["review_decisions"][idx] = "skipped"
-                        st.rerun()
+                    st.button(
+                        "Skip",
+                        key=f"skip_{idx}",
+                        use_container_width=True,
+                        on_click=_set_review_decision,
+                        args=(idx, "skipped"),
+                    )
 
     # --- Failed column ---
     with col_fail:
@@ -1101,40 +1194,36 @@ if st.session_state.get("processed"):
     )
     confirmed_indices = [i for i, d in review_decisions.items() if d == "confirmed"]
 
-    # If there are confirmed items that need writing, rebuild the Excel
-    if (
-        confirmed_indices
-        and all_reviewed
-        and not st.session_state.get("reviews_written")
-    ):
-        nominal_rows = st.session_state.get("nominal_mapping_rows", [])
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            maintenance_path = temp_path / "maintenance.xlsx"
-            maintenance_path.write_bytes(st.session_state["updated_excel_bytes"])
-
-            with ExcelWriter(maintenance_path, create_backup=False) as writer:
-                for idx in confirmed_indices:
-                    result = review_results[idx]
-                    inv = result.invoice
-                    nom_code = lookup_nominal_code(
-                        inv.supplier_name,
-                        nominal_rows,
-                        invoice_text=f"{inv.description} {inv.raw_text}",
-                    )
-                    writer.update_po_record(
-                        result.po_record.sheet_name,
-                        result.po_record.row_index,
-                        result.invoice.invoice_number,
-                        result.invoice.net_amount,
-                        datetime.now(),
-                        nominal_code=nom_code,
-                    )
-
-            with open(maintenance_path, "rb") as f:
-                st.session_state["updated_excel_bytes"] = f.read()
-            st.session_state["reviews_written"] = True
+    # Once every review is resolved, apply the queued auto-updates and the
+    # confirmed reviews to the uploaded workbook in a single load/save
+    if all_reviewed and not st.session_state.get("excel_written"):
+        # Nominal codes were looked up during processing (same read-only
+        # mapping), so the stored result.nominal_code is reused here.
+        signed_at = datetime.now()
+        updates = list(st.session_state["pending_updates"])
+        for idx in confirmed_indices:
+            result = review_results[idx]
+            inv = result.invoice
+            updates.append(
+                PORecordUpdate(
+                    result.po_record.sheet_name,
+                    result.po_record.row_index,
+                    inv.invoice_number,
+                    inv.net_amount,
+                    signed_at,
+                    nominal_code=result.nominal_code,
+                )
+            )
+        # Updated entirely in memory; to_bytes hands back the upload
+        # unchanged when there was nothing to write.
+        with st.spinner("Writing updated Excel..."), closing(
+            ExcelWriter(
+                io.BytesIO(st.session_state["workbook_bytes"]), create_backup=False
+            )
+        ) as writer:
+            writer.update_po_records(updates)
+            st.session_state["updated_excel_bytes"] = writer.to_bytes()
+        st.session_state["excel_written"] = True
 
     # --- Download section ---
     st.markdown('<hr class="section-divider">', unsafe_allow_html=True)
@@ -1148,13 +1237,15 @@ if st.session_state.get("processed"):
                 f"Excel includes {len(auto_results)} auto-updated + {confirmed_count} confirmed invoices."
             )
 
+        # One timestamp so all three downloads carry the same datestamp
+        now = datetime.now()
         dc1, dc2, dc3 = st.columns(3)
 
         with dc1:
             st.download_button(
                 label="Download Updated Excel",
                 data=st.session_state["updated_excel_bytes"],
-                file_name=f"Maintenance_POs_Updated_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                file_name=f"Maintenance_POs_Updated_{now.strftime('%Y%m%d_%H%M%S')}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 type="primary",
                 use_container_width=True,
@@ -1164,7 +1255,7 @@ if st.session_state.get("processed"):
             st.download_button(
                 label="Download CSV Summary",
                 data=st.session_state["csv_content"],
-                file_name=f"invoice_summary_{datetime.now().strftime('%Y%m%d')}.csv",
+                file_name=f"invoice_summary_{now.strftime('%Y%m%d')}.csv",
                 mime="text/csv",
                 use_container_width=True,
             )
@@ -1173,7 +1264,7 @@ if st.session_state.get("processed"):
             st.download_button(
                 label="Download Detailed Report",
                 data=st.session_state["report_content"],
-                file_name=f"invoice_report_{datetime.now().strftime('%Y%m%d')}.txt",
+                file_name=f"invoice_report_{now.strftime('%Y%m%d')}.txt",
                 mime="text/plain",
                 use_container_width=True,
             )